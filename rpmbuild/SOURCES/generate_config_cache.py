@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Generate config.yml.json from the shipped config.yml for RPM builds
+Author: travis@michettetech.com
+
+Log Viewer reads the JSON sidecar instead of parsing the YAML when the
+sidecar is at least as new as config.yml, so shipping it pre-generated
+avoids a YAML parse on every launch from the read-only install directory.
+"""
+
+import json
+import sys
+
+import yaml
+
+def generate_config_cache(config_path='config.yml'):
+    """Write the parsed config next to the YAML file as JSON"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f)
+    except FileNotFoundError:
+        print(f"Error: {config_path} not found")
+        return False
+    except yaml.YAMLError as e:
+        print(f"Error: could not parse {config_path}: {e}")
+        return False
+    
+    with open(config_path + '.json', 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+    
+    print(f"Generated {config_path}.json")
+    return True
+
+if __name__ == "__main__":
+    config_file = sys.argv[1] if len(sys.argv) > 1 else 'config.yml'
+    if not generate_config_cache(config_file):
+        sys.exit(1)
@@ -1,35 +1,54 @@
 import sys
-import yaml
+import json
+import codecs
+import mmap
 import re
 import os
 import argparse
 import time
+import threading
+import collections
+import functools
 import warnings
 import platform
 from enum import Enum
 
+@functools.lru_cache(maxsize=None)
+def load_yaml_module():
+    """Import PyYAML on first use and return (yaml, SafeLoader, SafeDumper)"""
+    # Startup normally reads the config from its JSON cache, so PyYAML is only
+    # imported once a config actually has to be parsed or written
+    import yaml
+    # Use the libyaml-backed loader/dumper when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return yaml, SafeLoader, SafeDumper
+
 # Suppress deprecation warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
+# The platform never changes while running, so look it up once
+PLATFORM_SYSTEM = platform.system()
+
+# VERSION=... line of a Build_Version file
+_VERSION_LINE_RE = re.compile(r'^VERSION=(.*)$', re.M)
+
 def get_application_version():
     """Read version from Build_Version file or return default"""
-    try:
-        # Try to read from Build_Version file (bundled with app)
-        with open('Build_Version', 'r') as f:
-            for line in f:
-                if line.startswith('VERSION='):
-                    return line.split('=')[1].strip()
-    except FileNotFoundError:
+    # Try the file bundled with the app first, then the one in the script directory
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    for version_file in ('Build_Version', os.path.join(script_dir, 'Build_Version')):
         try:
-            # Fallback: try to read from script directory
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            version_file = os.path.join(script_dir, 'Build_Version')
             with open(version_file, 'r') as f:
-                for line in f:
-                    if line.startswith('VERSION='):
-                        return line.split('=')[1].strip()
+                data = f.read()
         except FileNotFoundError:
-            pass
+            continue
+        match = _VERSION_LINE_RE.search(data)
+        if match:
+            return match.group(1).strip()
+        break
     return "4.0.5"  # Default fallback version
 
 # Get application version
@@ -42,18 +61,19 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QTextEdit,
                            QDialogButtonBox, QMessageBox, QInputDialog,
                            QProgressBar, QScrollBar, QPlainTextEdit, QMenuBar,
                            QMenu, QTextBrowser, QScrollArea, QCheckBox)
-from PyQt6.QtGui import QTextCharFormat, QColor, QSyntaxHighlighter, QPalette, QTextCursor, QFont
+from PyQt6.QtGui import QTextCharFormat, QColor, QSyntaxHighlighter, QPalette, QTextCursor, QFont, QTextDocument
 from PyQt6.QtCore import (Qt, QRunnable, QThreadPool, pyqtSignal, QObject, 
                          pyqtSlot, QTimer, QSize, QStandardPaths)
 from PyQt6.QtGui import QShortcut, QKeySequence
 
 # Windows-specific font handling
+@functools.lru_cache(maxsize=None)
 def get_monospace_font():
     """Get the best monospace font for the current platform"""
-    if platform.system() == 'Windows':
+    if PLATFORM_SYSTEM == 'Windows':
         # Windows preferred monospace fonts in order of preference
         fonts = ['Consolas', 'Courier New', 'Lucida Console', 'monospace']
-    elif platform.system() == 'Darwin':  # macOS
+    elif PLATFORM_SYSTEM == 'Darwin':  # macOS
         fonts = ['Monaco', 'Menlo', 'Courier New', 'monospace']
     else:  # Linux and others
         fonts = ['DejaVu Sans Mono', 'Liberation Mono', 'monospace']
@@ -68,6 +88,12 @@ class ThemeMode(Enum):
     DARK = "dark"
 
 class ThemeColors:
+    # Themes are fixed constants, so skip the per-instance __dict__
+    __slots__ = ('window_bg', 'window_text', 'base_bg', 'alt_base_bg', 'text_color',
+                 'button_bg', 'button_text', 'border_color', 'hover_color', 'pressed_color',
+                 'editor_bg', 'editor_text', 'highlight_bg', 'highlight_text',
+                 'menu_bg', 'menu_text', 'menu_hover')
+
     def __init__(self, 
                  window_bg="#ffffff", 
                  window_text="#000000", 
@@ -145,14 +171,50 @@ THEME_DARK = ThemeColors(
     menu_hover="#4f4f4f"
 )
 
+# Parsed help page documents keyed by (theme object, monospace font)
+_HELP_DOCUMENT_CACHE = {}
+# Help dialog stylesheets keyed by (theme object, monospace font)
+_HELP_STYLE_CACHE = {}
+
+# Dialog-wide stylesheets keyed by (dialog class, theme object)
+_DIALOG_STYLE_CACHE = {}
+
+def get_dialog_stylesheet(dialog):
+    """Get the dialog-wide stylesheet for a dialog's theme, building it once per dialog class and theme"""
+    key = (type(dialog), dialog.theme_colors)
+    stylesheet = _DIALOG_STYLE_CACHE.get(key)
+    if stylesheet is None:
+        stylesheet = _DIALOG_STYLE_CACHE[key] = dialog.build_stylesheet()
+    return stylesheet
+
+# One "schema key value" line of gsettings list-recursively output
+_GSETTINGS_LINE_RE = re.compile(r'^org\.gnome\.desktop\.interface (\S+) (.*)$', re.M)
+
+# Last system theme probe result, reused for a few seconds
+_SYSTEM_THEME_CACHE = {'time': 0.0, 'is_dark': None}
+_SYSTEM_THEME_TTL = 5.0
+
 def detect_system_theme():
-    """Detect if the system is using a dark theme"""
+    """Detect if the system is using a dark theme, reusing a recent result"""
+    # Probing can exec gsettings several times, and every dialog asks again
+    now = time.monotonic()
+    if _SYSTEM_THEME_CACHE['is_dark'] is not None and now - _SYSTEM_THEME_CACHE['time'] < _SYSTEM_THEME_TTL:
+        return _SYSTEM_THEME_CACHE['is_dark']
+    is_dark = probe_system_theme()
+    _SYSTEM_THEME_CACHE['time'] = now
+    _SYSTEM_THEME_CACHE['is_dark'] = is_dark
+    return is_dark
+
+def invalidate_system_theme_cache():
+    """Force the next detect_system_theme call to probe the system again"""
+    _SYSTEM_THEME_CACHE['is_dark'] = None
+
+def probe_system_theme():
+    """Probe the platform settings for a dark theme"""
     try:
         # Platform-specific detection methods
-        system_platform = platform.system()
-        
         # Try environment variables first (works on many Linux systems)
-        if system_platform == 'Linux':
+        if PLATFORM_SYSTEM == 'Linux':
             # Check common environment variables for dark theme
             gtk_theme = os.environ.get('GTK_THEME', '').lower()
             kde_theme = os.environ.get('KDE_SESSION_VERSION', '')
@@ -166,29 +228,26 @@ def detect_system_theme():
             try:
                 import subprocess
                 
-                # 1. Check modern GNOME color-scheme setting (GNOME 42+)
-                result = subprocess.run(['gsettings', 'get', 'org.gnome.desktop.interface', 'color-scheme'], 
+                # Read every interface key in one gsettings call instead of one per key
+                result = subprocess.run(['gsettings', 'list-recursively', 'org.gnome.desktop.interface'], 
                                       capture_output=True, text=True, timeout=2)
                 if result.returncode == 0:
-                    color_scheme = result.stdout.strip().strip("'\"")
-                    if 'dark' in color_scheme.lower():
+                    settings = dict(_GSETTINGS_LINE_RE.findall(result.stdout))
+                    
+                    # 1. Check modern GNOME color-scheme setting (GNOME 42+)
+                    color_scheme = settings.get('color-scheme', '').strip("'\"").lower()
+                    if 'dark' in color_scheme:
                         return True
-                    elif 'light' in color_scheme.lower():
+                    elif 'light' in color_scheme:
                         return False
-                
-                # 2. Check legacy GTK theme name
-                result = subprocess.run(['gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-theme'], 
-                                      capture_output=True, text=True, timeout=2)
-                if result.returncode == 0:
-                    gtk_theme_name = result.stdout.strip().strip("'\"")
-                    if 'dark' in gtk_theme_name.lower():
+                    
+                    # 2. Check legacy GTK theme name
+                    gtk_theme_name = settings.get('gtk-theme', '').strip("'\"").lower()
+                    if 'dark' in gtk_theme_name:
                         return True
-                
-                # 3. Check legacy prefer-dark-theme setting
-                result = subprocess.run(['gsettings', 'get', 'org.gnome.desktop.interface', 'gtk-application-prefer-dark-theme'], 
-                                      capture_output=True, text=True, timeout=2)
-                if result.returncode == 0:
-                    prefer_dark = result.stdout.strip().lower()
+                    
+                    # 3. Check legacy prefer-dark-theme setting
+                    prefer_dark = settings.get('gtk-application-prefer-dark-theme', '').lower()
                     if prefer_dark == 'true':
                         return True
                         
@@ -257,6 +316,13 @@ def get_theme_colors(theme_mode):
     else:  # LIGHT
         return THEME_LIGHT
 
+def get_parent_theme_colors(parent):
+    """Get the theme a dialog should follow: its parent's, or the system theme without one"""
+    # Dialogs carry theme_colors and the main window carries current_theme_colors;
+    # both are the shared theme constants, so nothing is rebuilt per dialog
+    theme_colors = getattr(parent, 'theme_colors', None) or getattr(parent, 'current_theme_colors', None)
+    return theme_colors or get_theme_colors(ThemeMode.SYSTEM)
+
 # Cross-platform configuration path handling
 def get_config_path():
     """Get the appropriate configuration file path for the current platform"""
@@ -266,7 +332,7 @@ def get_config_path():
         return user_config_path
     
     # If user default config doesn't exist, use platform-specific paths
-    if platform.system() == 'Windows':
+    if PLATFORM_SYSTEM == 'Windows':
         # Use Windows AppData directory for configuration
         app_data = os.environ.get('APPDATA', os.path.expanduser('~'))
         config_dir = os.path.join(app_data, 'LogViewer')
@@ -276,7 +342,7 @@ def get_config_path():
             except OSError:
                 pass
         return os.path.join(config_dir, 'config.yml')
-    elif platform.system() == 'Darwin':  # macOS
+    elif PLATFORM_SYSTEM == 'Darwin':  # macOS
         # Use macOS Application Support directory
         app_support = os.path.join(os.path.expanduser('~'), 'Library', 'Application Support')
         config_dir = os.path.join(app_support, 'LogViewer')
@@ -290,6 +356,37 @@ def get_config_path():
         # Use current directory for other platforms (Linux, etc.)
         return 'config.yml'
 
+# Recently loaded configs as path -> ((mtime_ns, size), JSON text), so loading an
+# unchanged config again, as happens after every opened file, skips the disk
+_CONFIG_CACHE = collections.OrderedDict()
+_CONFIG_CACHE_SIZE = 16
+
+def cache_config(path, version, cache_data):
+    """Remember the JSON text of the config loaded from path"""
+    cache_key = os.path.abspath(path)
+    _CONFIG_CACHE[cache_key] = (version, cache_data)
+    _CONFIG_CACHE.move_to_end(cache_key)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+
+def invalidate_config_cache(path=None):
+    """Forget the cached config for path, or every cached config if no path is given"""
+    if path is None:
+        _CONFIG_CACHE.clear()
+    else:
+        _CONFIG_CACHE.pop(os.path.abspath(path), None)
+
+def get_cache_path(filename):
+    """Get the path of a cache file in the platform's per-user cache directory"""
+    if PLATFORM_SYSTEM == 'Windows':
+        cache_dir = os.path.join(os.environ.get('LOCALAPPDATA', os.path.expanduser('~')), 'LogViewer')
+    elif PLATFORM_SYSTEM == 'Darwin':  # macOS
+        cache_dir = os.path.join(os.path.expanduser('~'), 'Library', 'Caches', 'LogViewer')
+    else:
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        cache_dir = os.path.join(cache_home, 'log_viewer')
+    return os.path.join(cache_dir, filename)
+
 # Define constant values for Qt enums that might differ between PyQt versions
 class QtConstants:
     # QTextCursor movement constants
@@ -313,48 +410,212 @@ class QtConstants:
     Ok = 0x00000400       # QDialogButtonBox.Ok
     Cancel = 0x00000800   # QDialogButtonBox.Cancel
 
+# Resolve PyQt version differences once at import instead of on every call
+if hasattr(QTextCursor, 'MoveOperation'):
+    _MOVE_END = QTextCursor.MoveOperation.End
+elif hasattr(QTextCursor, 'End'):
+    _MOVE_END = QTextCursor.End
+else:
+    _MOVE_END = QtConstants.MoveEnd
+
+if hasattr(QTextCursor, 'MoveOperation'):
+    _MOVE_START = QTextCursor.MoveOperation.Start
+elif hasattr(QTextCursor, 'Start'):
+    _MOVE_START = QTextCursor.Start
+else:
+    _MOVE_START = QtConstants.MoveStart
+
+if hasattr(QTextCursor, 'MoveMode'):
+    _KEEP_ANCHOR = QTextCursor.MoveMode.KeepAnchor
+elif hasattr(QTextCursor, 'KeepAnchor'):
+    _KEEP_ANCHOR = QTextCursor.KeepAnchor
+else:
+    _KEEP_ANCHOR = QtConstants.KeepAnchor
+
+if hasattr(QPlainTextEdit, 'LineWrapMode'):
+    _NO_WRAP = QPlainTextEdit.LineWrapMode.NoWrap
+    _WRAP_WIDGET_WIDTH = QPlainTextEdit.LineWrapMode.WidgetWidth
+else:
+    _NO_WRAP = QPlainTextEdit.NoWrap
+    _WRAP_WIDGET_WIDTH = QPlainTextEdit.WidgetWidth
+
+# QDialog.exec_ was renamed to exec in PyQt6
+_dialog_exec = QDialog.exec if hasattr(QDialog, 'exec') else QDialog.exec_
+
+# ANSI SGR (color/style) sequences, with or without the leading ESC byte. Only used
+# for stripping, so there are no capture groups for the engine to record.
+_ANSI_SGR_RE = re.compile(r'\x1b?\[[0-9;]*m')
+# ESC-prefixed SGR sequences, capturing the codes, for inserting colored text
+_ANSI_SGR_CODES_RE = re.compile(r'\x1b\[([0-9;]*)m')
+# ESC-prefixed cursor movement and any other escape sequences, for stripping
+_ANSI_ESC_SGR_RE = re.compile(r'\x1b\[[0-9;]*m')
+_ANSI_CURSOR_RE = re.compile(r'\x1b\[[0-9;]*[ABCDHJKfhl]')
+_ANSI_OTHER_RE = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
+
+# Invisible formatting characters that confuse the editor are dropped and Unicode
+# line/paragraph separators become plain newlines, all in one translate pass
+_UNICODE_CLEANUP = str.maketrans({
+    '\u202a': '',  # Left-to-right embedding
+    '\u202b': '',  # Right-to-left embedding
+    '\u202c': '',  # Pop directional formatting
+    '\u202d': '',  # Left-to-right override
+    '\u202e': '',  # Right-to-left override
+    '\u200b': '',  # Zero-width space
+    '\u200c': '',  # Zero-width non-joiner
+    '\u200d': '',  # Zero-width joiner
+    '\u2060': '',  # Word joiner
+    '\ufeff': '',  # Zero-width no-break space (BOM)
+    '\u2028': '\n',  # Line separator -> normal newline
+    '\u2029': '\n',  # Paragraph separator -> normal newline
+})
+# The subset clean_text_basic removes when ANSI processing is off
+_DIRECTIONAL_CLEANUP = str.maketrans({
+    '\u202a': '',  # Left-to-right embedding
+    '\u202c': '',  # Pop directional formatting
+})
+
+# ANSI foreground colors as one flat table indexed by SGR code - 30, built once at
+# import; 30-37 are the normal and 90-97 the bright colors, everything between is None
+_ANSI_COLOR_CODES = {
+    30: QColor(0, 0, 0),        # Black
+    31: QColor(255, 0, 0),      # Red
+    32: QColor(0, 255, 0),      # Green
+    33: QColor(255, 255, 0),    # Yellow
+    34: QColor(0, 0, 255),      # Blue
+    35: QColor(255, 0, 255),    # Magenta
+    36: QColor(0, 255, 255),    # Cyan
+    37: QColor(255, 255, 255),  # White
+    90: QColor(128, 128, 128),  # Bright Black
+    91: QColor(255, 128, 128),  # Bright Red
+    92: QColor(128, 255, 128),  # Bright Green
+    93: QColor(255, 255, 128),  # Bright Yellow
+    94: QColor(128, 128, 255),  # Bright Blue
+    95: QColor(255, 128, 255),  # Bright Magenta
+    96: QColor(128, 255, 255),  # Bright Cyan
+    97: QColor(255, 255, 255),  # Bright White
+}
+_ANSI_COLORS = tuple(_ANSI_COLOR_CODES.get(code) for code in range(30, 98))
+
+# Empty format returned with every stripped line; shared, so callers must not modify it
+_PLAIN_FORMAT = QTextCharFormat()
+
+# Character formats of inserted ANSI text keyed by SGR code string, e.g. "1;32".
+# Logs repeat a handful of codes, so this stays small; the cap guards odd input.
+_ANSI_FORMAT_CACHE = {}
+_ANSI_FORMAT_CACHE_SIZE = 256
+
+def get_ansi_format(code):
+    """Get the shared character format for an SGR code string, building it once per code"""
+    format_obj = _ANSI_FORMAT_CACHE.get(code)
+    if format_obj is not None:
+        return format_obj
+    try:
+        # Split compound codes like "0;32" into individual codes; an empty code means reset
+        codes = [int(c) for c in code.split(';') if c]
+    except ValueError:
+        # If parsing fails, just continue without color
+        return _PLAIN_FORMAT
+    format_obj = QTextCharFormat()
+    for color_code in codes:
+        if color_code == 0:
+            # Reset formatting
+            format_obj = QTextCharFormat()
+        elif color_code == 1:
+            # Bold
+            try:
+                format_obj.setFontWeight(QFont.Weight.Bold)
+            except AttributeError:
+                format_obj.setFontWeight(700)
+        elif 30 <= color_code <= 97:
+            # Apply color, straight from the flat table; codes 38-89 have no entry
+            color = _ANSI_COLORS[color_code - 30]
+            if color is not None:
+                format_obj.setForeground(color)
+    # Resets, empty codes and codes without a supported effect all share the plain format
+    if not format_obj.propertyCount():
+        format_obj = _PLAIN_FORMAT
+    if len(_ANSI_FORMAT_CACHE) < _ANSI_FORMAT_CACHE_SIZE:
+        _ANSI_FORMAT_CACHE[code] = format_obj
+    return format_obj
+
 class AnsiColorParser:
     def __init__(self):
         self.reset_format = QTextCharFormat()
         self.reset_format.setForeground(QColor(255, 255, 255))  # Default white text
         
-        # ANSI color mapping
-        self.colors = {
-            30: QColor(0, 0, 0),        # Black
-            31: QColor(255, 0, 0),      # Red
-            32: QColor(0, 255, 0),      # Green
-            33: QColor(255, 255, 0),    # Yellow
-            34: QColor(0, 0, 255),      # Blue
-            35: QColor(255, 0, 255),    # Magenta
-            36: QColor(0, 255, 255),    # Cyan
-            37: QColor(255, 255, 255),  # White
-            90: QColor(128, 128, 128),  # Bright Black
-            91: QColor(255, 128, 128),  # Bright Red
-            92: QColor(128, 255, 128),  # Bright Green
-            93: QColor(255, 255, 128),  # Bright Yellow
-            94: QColor(128, 128, 255),  # Bright Blue
-            95: QColor(255, 128, 255),  # Bright Magenta
-            96: QColor(128, 255, 255),  # Bright Cyan
-            97: QColor(255, 255, 255),  # Bright White
-        }
+        # ANSI color table, indexed by SGR code - 30
+        self.colors = _ANSI_COLORS
 
     def parse_ansi(self, text):
         """Simple ANSI parser that strips codes and returns clean text"""
         # For now, just remove ANSI codes to prevent display issues
         # Future enhancement can add color rendering back safely
-        import re
+        
+        # Every sequence contains '[', so most lines can skip the regex entirely
+        if '[' not in text:
+            return [(text, _PLAIN_FORMAT)]
         
         # Remove ANSI escape sequences
-        ansi_pattern = re.compile(r'(\x1b)?\[([0-9;]*)m')
-        clean_text = ansi_pattern.sub('', text)
+        clean_text = _ANSI_SGR_RE.sub('', text)
         
         # Return as a single segment with no special formatting
-        return [(clean_text, QTextCharFormat())]
+        return [(clean_text, _PLAIN_FORMAT)]
+
+# Parsed colors and their readable text colors keyed by color string, shared by every config reload
+_COLOR_CACHE = {}
+
+def get_color(name):
+    """Get the (QColor, readable text QColor) pair for a color string, parsing each string only once"""
+    cached = _COLOR_CACHE.get(name)
+    if cached is None:
+        color = QColor(name)
+        # Dark text on light backgrounds, light text on dark ones
+        text_color = QColor(0, 0, 0) if color.lightness() > 128 else QColor(255, 255, 255)
+        cached = _COLOR_CACHE[name] = (color, text_color)
+    return cached
+
+# One color dialog reused by every color picker instead of building a new one per click
+_COLOR_DIALOG = None
+
+def pick_color(initial, parent, title):
+    """Show the shared color dialog over parent, returning an invalid QColor when cancelled"""
+    global _COLOR_DIALOG
+    if _COLOR_DIALOG is None:
+        _COLOR_DIALOG = QColorDialog()
+    # Borrow the parent for placement and styling, then release it so the dialog
+    # outlives short-lived parents such as the term format dialog
+    _COLOR_DIALOG.setParent(parent, _COLOR_DIALOG.windowFlags())
+    try:
+        _COLOR_DIALOG.setWindowTitle(title)
+        _COLOR_DIALOG.setCurrentColor(initial)
+        if _COLOR_DIALOG.exec() == QDialog.DialogCode.Accepted:
+            return _COLOR_DIALOG.currentColor()
+        return QColor()
+    finally:
+        _COLOR_DIALOG.setParent(None, _COLOR_DIALOG.windowFlags())
 
 class LogHighlighter(QSyntaxHighlighter):
+    # Rehighlighting runs highlightBlock once per block in Python, which dominates
+    # the time to show a large file; documents above this many characters are left
+    # uncolored unless large file highlighting is turned on
+    MAX_HIGHLIGHT_CHARS = 512 * 1024
+    # Documents with more blocks than this are rehighlighted in batches of this size
+    # from the event loop after a change of terms, so the UI stays responsive
+    REHIGHLIGHT_BATCH_BLOCKS = 2000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.view = None  # Text edit showing the document, used to rehighlight visible lines first
+        self.rehighlight_ranges = []  # Pending (first, end) block number ranges
+        self.rehighlight_timer = QTimer()
+        self.rehighlight_timer.setInterval(0)
+        self.rehighlight_timer.timeout.connect(self.rehighlight_next_batch)
         self.highlight_terms = []
+        self.term_formats = []  # Format of each entry of highlight_terms, by index
+        self.applied_terms = None  # Copy of the terms last passed to set_highlight_terms
+        # Compiled case-sensitive / case-insensitive terms, see compile_terms
+        self.sensitive_terms = None
+        self.insensitive_terms = None
         self.default_highlight_format = QTextCharFormat()
         # Default cornflower blue color for highlighting with black text
         self.default_highlight_format.setBackground(QColor(100, 149, 237))
@@ -371,6 +632,13 @@ class LogHighlighter(QSyntaxHighlighter):
         self.bookmark_format.setForeground(QColor(0, 0, 0))
 
     def set_highlight_terms(self, terms):
+        # The config is reapplied after every file load; unchanged terms would only
+        # repeat the full rehighlight done when the highlighter was reattached
+        applied_terms = [dict(term) if isinstance(term, dict) else term for term in terms]
+        if applied_terms == self.applied_terms:
+            return
+        self.applied_terms = applied_terms
+        
         self.highlight_terms = []
         for term in terms:
             if isinstance(term, dict):
@@ -380,7 +648,7 @@ class LogHighlighter(QSyntaxHighlighter):
                 # Set background color
                 if 'color' in term:
                     # Convert hex color to QColor
-                    color = QColor(term['color'])
+                    color, _ = get_color(term['color'])
                     highlight_format.setBackground(color)
                 else:
                     # Use default background color
@@ -389,15 +657,12 @@ class LogHighlighter(QSyntaxHighlighter):
                 # Set text color
                 if 'text_color' in term:
                     # Use custom text color
-                    text_color = QColor(term['text_color'])
+                    text_color, _ = get_color(term['text_color'])
                     highlight_format.setForeground(text_color)
                 elif 'color' in term:
                     # Auto-select text color based on background brightness (legacy behavior)
-                    bg_color = QColor(term['color'])
-                    if bg_color.lightness() > 128:
-                        highlight_format.setForeground(QColor(0, 0, 0))
-                    else:
-                        highlight_format.setForeground(QColor(255, 255, 255))
+                    _, auto_text_color = get_color(term['color'])
+                    highlight_format.setForeground(auto_text_color)
                 else:
                     # Use default text color
                     highlight_format.setForeground(QColor(0, 0, 0))
@@ -432,7 +697,90 @@ class LogHighlighter(QSyntaxHighlighter):
                     'term': term.lower(),
                     'format': self.default_highlight_format
                 })
-        self.rehighlight()
+        
+        # Terms are compiled here, once per change of terms, so highlightBlock
+        # only ever runs ready-made patterns
+        self.sensitive_terms = self.compile_terms(True)
+        self.insensitive_terms = self.compile_terms(False)
+        self.term_formats = [term_info['format'] for term_info in self.highlight_terms]
+        self.schedule_rehighlight()
+    
+    def schedule_rehighlight(self):
+        """Rehighlight the document, in batches starting at the first visible line if it is large"""
+        self.rehighlight_ranges = []
+        self.rehighlight_timer.stop()
+        document = self.document()
+        if document is None:
+            return
+        block_count = document.blockCount()
+        if block_count <= self.REHIGHLIGHT_BATCH_BLOCKS:
+            self.rehighlight()
+            return
+        
+        first_visible = 0
+        if self.view is not None:
+            first_visible = self.view.cursorForPosition(self.view.viewport().rect().topLeft()).blockNumber()
+        self.rehighlight_ranges = [(first_visible, block_count), (0, first_visible)]
+        self.rehighlight_next_batch()
+        self.rehighlight_timer.start()
+    
+    def rehighlight_next_batch(self):
+        """Rehighlight the next batch of blocks queued by schedule_rehighlight"""
+        document = self.document()
+        if document is None:
+            # Detached for a new file; reattaching rehighlights everything anyway
+            self.rehighlight_ranges = []
+        while self.rehighlight_ranges and self.rehighlight_ranges[0][0] >= self.rehighlight_ranges[0][1]:
+            self.rehighlight_ranges.pop(0)
+        if not self.rehighlight_ranges:
+            self.rehighlight_timer.stop()
+            return
+        
+        first, end = self.rehighlight_ranges[0]
+        last = min(first + self.REHIGHLIGHT_BATCH_BLOCKS, end)
+        self.rehighlight_ranges[0] = (last, end)
+        block = document.findBlockByNumber(first)
+        while block.isValid() and block.blockNumber() < last:
+            self.rehighlightBlock(block)
+            block = block.next()
+    
+    def compile_terms(self, case_sensitive):
+        """Compile the terms of one case mode into (search pattern, lookahead pattern, term indexes), or None"""
+        indexes = [i for i, term_info in enumerate(self.highlight_terms)
+                   if term_info.get('case_sensitive', False) == case_sensitive]
+        if not indexes:
+            return None
+        
+        # Later terms win, so list them first: at each position the lookahead pattern
+        # then reports the latest-listed term starting there, one group per term.
+        # The plain alternation finds where the first term occurs in a line, letting
+        # lines without any term be rejected in a single scan.
+        indexes.reverse()
+        escaped = [re.escape(self.highlight_terms[i]['term']) for i in indexes]
+        search_re = re.compile('|'.join(escaped))
+        lookahead_re = re.compile('(?=' + '|'.join(f'({term})' for term in escaped) + ')')
+        return search_re, lookahead_re, indexes
+    
+    def match_terms(self, compiled_terms, text):
+        """Return the index of the latest-listed term occurring in text, or -1"""
+        if compiled_terms is None:
+            return -1
+        search_re, lookahead_re, indexes = compiled_terms
+        first_match = search_re.search(text)
+        if first_match is None:
+            return -1
+        # With a single term the plain search already gives the answer
+        if len(indexes) == 1:
+            return indexes[0]
+        best_index = -1
+        for match in lookahead_re.finditer(text, first_match.start()):
+            term_index = indexes[match.lastindex - 1]
+            # indexes[0] is the latest-listed term; nothing later in the line can beat it
+            if term_index == indexes[0]:
+                return term_index
+            if term_index > best_index:
+                best_index = term_index
+        return best_index
 
     def set_search_highlight_range(self, start_pos, end_pos):
         """Set the range that is currently search-highlighted to avoid overriding it"""
@@ -446,8 +794,20 @@ class LogHighlighter(QSyntaxHighlighter):
     
     def set_bookmarked_lines(self, bookmarked_lines):
         """Set the lines that should have bookmark highlighting"""
-        self.bookmarked_lines = set(bookmarked_lines)
-        self.rehighlight()
+        bookmarked_lines = set(bookmarked_lines)
+        changed_lines = bookmarked_lines ^ self.bookmarked_lines
+        self.bookmarked_lines = bookmarked_lines
+        # Only lines that gained or lost a bookmark need highlighting again
+        if changed_lines and self.document():
+            # A block lookup per line costs more than one pass over the document
+            # once a large share of the lines changed
+            if len(changed_lines) > self.document().blockCount() // 5:
+                self.rehighlight()
+                return
+            for line_number in changed_lines:
+                block = self.document().findBlockByNumber(line_number - 1)
+                if block.isValid():
+                    self.rehighlightBlock(block)
     
     def add_bookmark_line(self, line_number):
         """Add a line to bookmark highlighting"""
@@ -478,36 +838,37 @@ class LogHighlighter(QSyntaxHighlighter):
                     self.rehighlightBlock(block)
 
     def highlightBlock(self, text):
-        # Get the current block's position in the document
+        # Plain viewing: nothing to color, so don't touch the block at all
+        if not self.highlight_terms and not self.bookmarked_lines:
+            return
+        
         block = self.currentBlock()
-        block_start = block.position()
-        block_end = block_start + block.length()
-        line_number = block.blockNumber() + 1  # 1-based line number
         
-        # Check if this line is bookmarked (highest priority)
-        if line_number in self.bookmarked_lines:
+        # Check if this line is bookmarked (highest priority); skip the
+        # block number lookup entirely while there are no bookmarks
+        if self.bookmarked_lines and block.blockNumber() + 1 in self.bookmarked_lines:
             self.setFormat(0, len(text), self.bookmark_format)
             return  # Bookmark highlighting takes precedence
         
         # Check if this block overlaps with search-highlighted area
         if (self.search_highlighted_start is not None and 
             self.search_highlighted_end is not None):
+            # Get the current block's position in the document
+            block_start = block.position()
+            block_end = block_start + block.length()
             # If this block overlaps with search highlighting, don't apply config highlighting
             if (block_start < self.search_highlighted_end and 
                 block_end > self.search_highlighted_start):
                 return
         
-        # Apply config-based highlighting only if not in search-highlighted area
-        for term_info in self.highlight_terms:
-            # Check if term matches based on case sensitivity
-            if term_info.get('case_sensitive', False):
-                # Case-sensitive search
-                if term_info['term'] in text:
-                    self.setFormat(0, len(text), term_info['format'])
-            else:
-                # Case-insensitive search (default)
-                if term_info['term'] in text.lower():
-                    self.setFormat(0, len(text), term_info['format'])
+        # Apply config-based highlighting only if not in search-highlighted area.
+        # When several terms match, the one listed last decides the line format.
+        # The line is only lowered when a case-insensitive term could still win
+        term_index = self.match_terms(self.sensitive_terms, text)
+        if self.insensitive_terms is not None and term_index < self.insensitive_terms[2][0]:
+            term_index = max(term_index, self.match_terms(self.insensitive_terms, text.lower()))
+        if term_index >= 0:
+            self.setFormat(0, len(text), self.term_formats[term_index])
 
 class HelpDialog(QDialog):
     def __init__(self, parent=None):
@@ -516,10 +877,7 @@ class HelpDialog(QDialog):
         self.resize(800, 600)
         
         # Use parent's theme
-        if parent and hasattr(parent, 'current_theme_colors'):
-            self.theme_colors = parent.current_theme_colors
-        else:
-            self.theme_colors = get_theme_colors(ThemeMode.SYSTEM)
+        self.theme_colors = get_parent_theme_colors(parent)
         
         # Set palette from theme
         palette = self.parent().palette() if parent else QPalette()
@@ -527,17 +885,13 @@ class HelpDialog(QDialog):
         
         layout = QVBoxLayout(self)
         
+        browser_style, button_style = self.get_stylesheets()
+        
         # Create a text browser for the help content
         self.help_browser = QTextBrowser()
-        self.help_browser.setStyleSheet(f"""
-            QTextBrowser {{
-                background-color: {self.theme_colors.editor_bg};
-                color: {self.theme_colors.editor_text};
-                border: 1px solid {self.theme_colors.border_color};
-                font-family: {get_monospace_font()};
-                font-size: 12pt;
-            }}
-        """)
+        # The page has no links to follow
+        self.help_browser.setOpenLinks(False)
+        self.help_browser.setStyleSheet(browser_style)
         
         # Load help content
         self.load_help_content()
@@ -546,19 +900,7 @@ class HelpDialog(QDialog):
         
         # Close button
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme_colors.button_bg};
-                color: {self.theme_colors.button_text};
-                border: 1px solid {self.theme_colors.border_color};
-                padding: 8px;
-                border-radius: 3px;
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme_colors.hover_color};
-            }}
-        """)
+        close_btn.setStyleSheet(button_style)
         close_btn.clicked.connect(self.accept)
         
         btn_layout = QHBoxLayout()
@@ -566,8 +908,47 @@ class HelpDialog(QDialog):
         btn_layout.addWidget(close_btn)
         layout.addLayout(btn_layout)
     
+    def get_stylesheets(self):
+        """Get the (help browser, close button) stylesheets for the dialog's theme"""
+        font_family = get_monospace_font()
+        key = (self.theme_colors, font_family)
+        stylesheets = _HELP_STYLE_CACHE.get(key)
+        if stylesheets is None:
+            browser_style = f"""
+                QTextBrowser {{
+                    background-color: {self.theme_colors.editor_bg};
+                    color: {self.theme_colors.editor_text};
+                    border: 1px solid {self.theme_colors.border_color};
+                    font-family: {font_family};
+                    font-size: 12pt;
+                }}
+            """
+            button_style = f"""
+                QPushButton {{
+                    background-color: {self.theme_colors.button_bg};
+                    color: {self.theme_colors.button_text};
+                    border: 1px solid {self.theme_colors.border_color};
+                    padding: 8px;
+                    border-radius: 3px;
+                    min-width: 80px;
+                }}
+                QPushButton:hover {{
+                    background-color: {self.theme_colors.hover_color};
+                }}
+            """
+            stylesheets = _HELP_STYLE_CACHE[key] = (browser_style, button_style)
+        return stylesheets
+    
     def load_help_content(self):
         """Load help content from file or provide built-in content"""
+        # The page only depends on the theme, so later opens reuse the parsed document
+        # instead of building and parsing the HTML again
+        key = (self.theme_colors, get_monospace_font())
+        help_document = _HELP_DOCUMENT_CACHE.get(key)
+        if help_document is not None:
+            self.help_browser.setDocument(help_document)
+            return
+        
         # Determine header colors based on theme
         if self.theme_colors.editor_bg == "#2b2b2b":  # Dark theme
             h1_color = "#4a9eff"
@@ -755,7 +1136,13 @@ line_numbers_enabled: false</pre>
         </body>
         </html>
         """
-        self.help_browser.setHtml(help_content)
+        # The document has no parent, so it outlives the dialog that parsed it
+        help_document = QTextDocument()
+        help_document.setUndoRedoEnabled(False)
+        help_document.setDefaultFont(self.help_browser.font())
+        help_document.setHtml(help_content)
+        _HELP_DOCUMENT_CACHE[key] = help_document
+        self.help_browser.setDocument(help_document)
 
 class AboutDialog(QDialog):
     def __init__(self, parent=None):
@@ -764,50 +1151,31 @@ class AboutDialog(QDialog):
         self.resize(350, 200)
         
         # Use parent's theme
-        if parent and hasattr(parent, 'current_theme_colors'):
-            self.theme_colors = parent.current_theme_colors
-        else:
-            self.theme_colors = get_theme_colors(ThemeMode.SYSTEM)
+        self.theme_colors = get_parent_theme_colors(parent)
         
         # Set palette from theme
         palette = self.parent().palette() if parent else QPalette()
         self.setPalette(palette)
         
+        # One stylesheet for the whole dialog; children are matched by object name
+        self.setStyleSheet(get_dialog_stylesheet(self))
+        
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         
         # Application info
         app_label = QLabel("Log Viewer Application")
-        app_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.theme_colors.text_color};
-                font-size: 18pt;
-                font-weight: bold;
-                text-align: center;
-            }}
-        """)
+        app_label.setObjectName("appLabel")
         app_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(app_label)
         
         company_label = QLabel("Michette Technologies")
-        company_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.theme_colors.text_color};
-                font-size: 14pt;
-                text-align: center;
-            }}
-        """)
+        company_label.setObjectName("companyLabel")
         company_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(company_label)
         
         version_label = QLabel(f"Version {APP_VERSION}")
-        version_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.theme_colors.text_color};
-                font-size: 12pt;
-                text-align: center;
-            }}
-        """)
+        version_label.setObjectName("versionLabel")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(version_label)
         
@@ -816,13 +1184,7 @@ class AboutDialog(QDialog):
         
         # Additional info
         info_label = QLabel("A powerful log file viewer with ANSI color support\nand configurable highlighting features.")
-        info_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.theme_colors.window_text};
-                font-size: 10pt;
-                text-align: center;
-            }}
-        """)
+        info_label.setObjectName("infoLabel")
         info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         info_label.setWordWrap(True)
         layout.addWidget(info_label)
@@ -832,8 +1194,39 @@ class AboutDialog(QDialog):
         
         # Close button
         close_btn = QPushButton("Close")
-        close_btn.setStyleSheet(f"""
-            QPushButton {{
+        close_btn.setObjectName("closeButton")
+        close_btn.clicked.connect(self.accept)
+        
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+    
+    def build_stylesheet(self):
+        """Build the dialog-wide stylesheet for the current theme"""
+        return f"""
+            QLabel#appLabel {{
+                color: {self.theme_colors.text_color};
+                font-size: 18pt;
+                font-weight: bold;
+                text-align: center;
+            }}
+            QLabel#companyLabel {{
+                color: {self.theme_colors.text_color};
+                font-size: 14pt;
+                text-align: center;
+            }}
+            QLabel#versionLabel {{
+                color: {self.theme_colors.text_color};
+                font-size: 12pt;
+                text-align: center;
+            }}
+            QLabel#infoLabel {{
+                color: {self.theme_colors.window_text};
+                font-size: 10pt;
+                text-align: center;
+            }}
+            QPushButton#closeButton {{
                 background-color: {self.theme_colors.button_bg};
                 color: {self.theme_colors.button_text};
                 border: 1px solid {self.theme_colors.border_color};
@@ -841,21 +1234,64 @@ class AboutDialog(QDialog):
                 border-radius: 3px;
                 min-width: 80px;
             }}
-            QPushButton:hover {{
+            QPushButton#closeButton:hover {{
                 background-color: {self.theme_colors.hover_color};
             }}
-        """)
-        close_btn.clicked.connect(self.accept)
-        
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        btn_layout.addWidget(close_btn)
-        layout.addLayout(btn_layout)
+        """
+
+# Custom color button stylesheets keyed by (color, theme border color)
+_COLOR_BUTTON_STYLE_CACHE = {}
+
+# Log level keywords of each smart color category, in priority order. Each branch
+# looks ahead through the whole term, so the first category with any keyword wins
+# no matter where in the term the keyword appears.
+_SMART_COLOR_RE = re.compile(
+    r'(?=.*(?:error|err|fatal|critical|fail))(?P<error>)'
+    r'|(?=.*(?:warning|warn|caution))(?P<warning>)'
+    r'|(?=.*(?:success|complete|done|ok))(?P<success>)'
+    r'|(?=.*(?:info|information))(?P<info>)'
+    r'|(?=.*(?:debug|trace|verbose))(?P<debug>)',
+    re.IGNORECASE | re.DOTALL)
+_SMART_COLORS = {
+    'error': QColor('#FF4444'),    # Red
+    'warning': QColor('#FFA500'),  # Orange
+    'success': QColor('#28A745'),  # Green
+    'info': QColor('#4A90E2'),     # Blue
+    'debug': QColor('#6C757D'),    # Gray
+    None: QColor(100, 149, 237),   # Default cornflower blue
+}
+# Human-readable names of the smart colors, keyed by category
+_SMART_COLOR_LABELS = {
+    'error': 'Red',
+    'warning': 'Orange',
+    'success': 'Green',
+    'info': 'Blue',
+    'debug': 'Gray',
+    None: 'Default',
+}
+# The same names keyed by upper-case hex, for colors that did not come from a category
+_SMART_COLOR_NAMES = {_SMART_COLORS[category].name().upper(): label
+                      for category, label in _SMART_COLOR_LABELS.items() if category}
+
+def smart_color_category(term):
+    """Get the smart color category of a term, or None when no log level keyword matches"""
+    match = _SMART_COLOR_RE.match(term)
+    return match.lastgroup if match else None
 
 class TermFormatDialog(QDialog):
     # Signal to notify when apply is pressed
     applied = pyqtSignal(dict)
     
+    # Auto/Smart color presets, parsed once for every dialog
+    smart_colors = {
+        'Auto': None,  # Will be determined by term content
+        'Error': _SMART_COLORS['error'],      # Red for errors
+        'Warning': _SMART_COLORS['warning'],  # Orange for warnings
+        'Info': _SMART_COLORS['info'],        # Blue for info
+        'Success': _SMART_COLORS['success'],  # Green for success
+        'Debug': _SMART_COLORS['debug']       # Gray for debug
+    }
+    
     def __init__(self, parent=None, term="", bg_color=None, text_color=None, bold=False, case_sensitive=False):
         super().__init__(parent)
         self.setWindowTitle("Term Formatting")
@@ -863,32 +1299,11 @@ class TermFormatDialog(QDialog):
         self.resize(450, 350)  # Increased size for new UI elements
         
         # Get theme colors from parent
-        if parent and hasattr(parent, 'theme_colors'):
-            self.theme_colors = parent.theme_colors
-        elif parent and hasattr(parent, 'current_theme_colors'):
-            self.theme_colors = parent.current_theme_colors
-        else:
-            # Fallback theme colors for dark mode
-            self.theme_colors = type('', (), {
-                'window_bg': '#2b2b2b',
-                'window_text': '#ffffff',
-                'button_bg': '#404040',
-                'button_text': '#ffffff',
-                'border_color': '#555555',
-                'hover_color': '#505050',
-                'pressed_color': '#606060'
-            })()
+        self.theme_colors = get_parent_theme_colors(parent)
         
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {self.theme_colors.window_bg};
-                color: {self.theme_colors.window_text};
-            }}
-            QLabel {{
-                color: {self.theme_colors.window_text};
-                background: transparent;
-            }}
-        """)
+        # Hold off repaints while the widgets are built; the dialog stylesheet is
+        # applied once at the end so each child is polished a single time
+        self.setUpdatesEnabled(False)
         
         layout = QVBoxLayout(self)
         
@@ -896,17 +1311,13 @@ class TermFormatDialog(QDialog):
         term_layout = QHBoxLayout()
         term_layout.addWidget(QLabel("Term:"))
         self.term_edit = QLineEdit(term)
-        self.term_edit.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {self.theme_colors.button_bg};
-                color: {self.theme_colors.button_text};
-                border: 1px solid {self.theme_colors.border_color};
-                padding: 5px;
-                border-radius: 3px;
-            }}
-        """)
-        # Connect text change to smart color suggestions
-        self.term_edit.textChanged.connect(self.on_term_text_changed)
+        self.term_edit.setObjectName("termEdit")
+        # Connect text change to smart color suggestions, updated once typing pauses
+        self.suggestion_timer = QTimer(self)
+        self.suggestion_timer.setSingleShot(True)
+        self.suggestion_timer.setInterval(120)
+        self.suggestion_timer.timeout.connect(self.on_term_text_changed)
+        self.term_edit.textChanged.connect(lambda: self.suggestion_timer.start())
         term_layout.addWidget(self.term_edit)
         layout.addLayout(term_layout)
         
@@ -919,16 +1330,6 @@ class TermFormatDialog(QDialog):
         # Color selection buttons layout
         color_buttons_layout = QHBoxLayout()
         
-        # Auto/Smart color presets
-        self.smart_colors = {
-            'Auto': None,  # Will be determined by term content
-            'Error': '#FF4444',    # Red for errors
-            'Warning': '#FFA500',  # Orange for warnings 
-            'Info': '#4A90E2',     # Blue for info
-            'Success': '#28A745',  # Green for success
-            'Debug': '#6C757D'     # Gray for debug
-        }
-        
         # Add smart color buttons
         from PyQt6.QtWidgets import QComboBox
         self.bg_preset_combo = QComboBox()
@@ -936,26 +1337,8 @@ class TermFormatDialog(QDialog):
         for preset_name in self.smart_colors.keys():
             self.bg_preset_combo.addItem(preset_name)
         
-        self.bg_preset_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {self.theme_colors.button_bg};
-                color: {self.theme_colors.button_text};
-                border: 1px solid {self.theme_colors.border_color};
-                padding: 5px;
-                border-radius: 3px;
-                min-width: 100px;
-            }}
-            QComboBox:hover {{
-                background-color: {self.theme_colors.hover_color};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-            }}
-            QComboBox::down-arrow {{
-                width: 12px;
-                height: 12px;
-            }}
-        """)
+        self.bg_preset_combo.setObjectName("presetCombo")
+        self.auto_label = None  # Last label given to the Auto item
         self.bg_preset_combo.currentTextChanged.connect(self.on_preset_color_changed)
         color_buttons_layout.addWidget(self.bg_preset_combo)
         
@@ -973,6 +1356,7 @@ class TermFormatDialog(QDialog):
         text_layout = QHBoxLayout()
         text_layout.addWidget(QLabel("Text Color:"))
         self.text_color_btn = QPushButton("Choose Color")
+        self.text_color_btn.setObjectName("textColorButton")
         self.text_color = QColor(text_color) if text_color else None
         self.update_text_color_button()
         self.text_color_btn.clicked.connect(self.choose_text_color)
@@ -980,18 +1364,7 @@ class TermFormatDialog(QDialog):
         
         # Clear text color button
         self.clear_text_btn = QPushButton("Auto")
-        self.clear_text_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme_colors.button_bg};
-                color: {self.theme_colors.button_text};
-                border: 1px solid {self.theme_colors.border_color};
-                padding: 8px;
-                border-radius: 3px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme_colors.hover_color};
-            }}
-        """)
+        self.clear_text_btn.setObjectName("formatButton")
         self.clear_text_btn.clicked.connect(self.clear_text_color)
         text_layout.addWidget(self.clear_text_btn)
         layout.addLayout(text_layout)
@@ -999,65 +1372,13 @@ class TermFormatDialog(QDialog):
         # Bold checkbox
         self.bold_checkbox = QCheckBox("Bold Text")
         self.bold_checkbox.setChecked(bold)
-        self.bold_checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                color: {self.theme_colors.window_text};
-                padding: 5px;
-                spacing: 8px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 2px solid {self.theme_colors.border_color};
-                border-radius: 3px;
-                background-color: {self.theme_colors.button_bg};
-            }}
-            QCheckBox::indicator:hover {{
-                border: 2px solid {self.theme_colors.window_text};
-                background-color: {self.theme_colors.hover_color};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: #4CAF50;
-                border: 2px solid #4CAF50;
-                image: none;
-            }}
-            QCheckBox::indicator:checked:hover {{
-                background-color: #45a049;
-                border: 2px solid #45a049;
-            }}
-        """)
+        self.bold_checkbox.setObjectName("formatCheckBox")
         layout.addWidget(self.bold_checkbox)
         
         # Case sensitive checkbox
         self.case_sensitive_checkbox = QCheckBox("Case Sensitive")
         self.case_sensitive_checkbox.setChecked(case_sensitive)
-        self.case_sensitive_checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                color: {self.theme_colors.window_text};
-                padding: 5px;
-                spacing: 8px;
-            }}
-            QCheckBox::indicator {{
-                width: 18px;
-                height: 18px;
-                border: 2px solid {self.theme_colors.border_color};
-                border-radius: 3px;
-                background-color: {self.theme_colors.button_bg};
-            }}
-            QCheckBox::indicator:hover {{
-                border: 2px solid {self.theme_colors.window_text};
-                background-color: {self.theme_colors.hover_color};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: #4CAF50;
-                border: 2px solid #4CAF50;
-                image: none;
-            }}
-            QCheckBox::indicator:checked:hover {{
-                background-color: #45a049;
-                border: 2px solid #45a049;
-            }}
-        """)
+        self.case_sensitive_checkbox.setObjectName("formatCheckBox")
         layout.addWidget(self.case_sensitive_checkbox)
         
         # Buttons
@@ -1065,143 +1386,196 @@ class TermFormatDialog(QDialog):
         
         # Apply button
         apply_btn = QPushButton("Apply")
-        apply_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.theme_colors.button_bg};
-                color: {self.theme_colors.button_text};
-                border: 1px solid {self.theme_colors.border_color};
-                padding: 8px;
-                border-radius: 3px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme_colors.hover_color};
-            }}
-        """)
+        apply_btn.setObjectName("formatButton")
         apply_btn.clicked.connect(self.apply_changes)
         button_layout.addWidget(apply_btn)
         
         # OK button
         ok_btn = QPushButton("OK")
-        ok_btn.setStyleSheet(f"""
-            QPushButton {{
+        ok_btn.setObjectName("formatButton")
+        ok_btn.clicked.connect(self.accept)
+        
+        # Cancel button  
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setObjectName("formatButton")
+        cancel_btn.clicked.connect(self.reject)
+        
+        button_layout.addWidget(ok_btn)
+        button_layout.addWidget(cancel_btn)
+        layout.addLayout(button_layout)
+        
+        # One stylesheet for the whole dialog; children are matched by object name
+        self.setStyleSheet(get_dialog_stylesheet(self))
+        
+        self.on_term_text_changed()  # Set initial smart color suggestion
+        self.setUpdatesEnabled(True)
+    
+    def build_stylesheet(self):
+        """Build the dialog-wide stylesheet for the current theme"""
+        return f"""
+            QDialog {{
+                background-color: {self.theme_colors.window_bg};
+                color: {self.theme_colors.window_text};
+            }}
+            QLabel {{
+                color: {self.theme_colors.window_text};
+                background: transparent;
+            }}
+            QLineEdit#termEdit {{
                 background-color: {self.theme_colors.button_bg};
                 color: {self.theme_colors.button_text};
                 border: 1px solid {self.theme_colors.border_color};
-                padding: 8px;
+                padding: 5px;
                 border-radius: 3px;
             }}
-            QPushButton:hover {{
+            QComboBox#presetCombo {{
+                background-color: {self.theme_colors.button_bg};
+                color: {self.theme_colors.button_text};
+                border: 1px solid {self.theme_colors.border_color};
+                padding: 5px;
+                border-radius: 3px;
+                min-width: 100px;
+            }}
+            QComboBox#presetCombo:hover {{
                 background-color: {self.theme_colors.hover_color};
             }}
-        """)
-        ok_btn.clicked.connect(self.accept)
-        
-        # Cancel button  
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setStyleSheet(f"""
-            QPushButton {{
+            QComboBox#presetCombo::drop-down {{
+                border: none;
+            }}
+            QComboBox#presetCombo::down-arrow {{
+                width: 12px;
+                height: 12px;
+            }}
+            QPushButton#formatButton, QPushButton#textColorButton[autoColor="true"] {{
                 background-color: {self.theme_colors.button_bg};
                 color: {self.theme_colors.button_text};
                 border: 1px solid {self.theme_colors.border_color};
                 padding: 8px;
                 border-radius: 3px;
             }}
-            QPushButton:hover {{
+            QPushButton#formatButton:hover, QPushButton#textColorButton[autoColor="true"]:hover {{
                 background-color: {self.theme_colors.hover_color};
             }}
-        """)
-        cancel_btn.clicked.connect(self.reject)
-        
-        button_layout.addWidget(ok_btn)
-        button_layout.addWidget(cancel_btn)
-        layout.addLayout(button_layout)
-        
-        # Initialize color button appearance and smart suggestions
-        self.update_bg_color_button()
-        self.on_term_text_changed()  # Set initial smart color suggestion
+            QCheckBox#formatCheckBox {{
+                color: {self.theme_colors.window_text};
+                padding: 5px;
+                spacing: 8px;
+            }}
+            QCheckBox#formatCheckBox::indicator {{
+                width: 18px;
+                height: 18px;
+                border: 2px solid {self.theme_colors.border_color};
+                border-radius: 3px;
+                background-color: {self.theme_colors.button_bg};
+            }}
+            QCheckBox#formatCheckBox::indicator:hover {{
+                border: 2px solid {self.theme_colors.window_text};
+                background-color: {self.theme_colors.hover_color};
+            }}
+            QCheckBox#formatCheckBox::indicator:checked {{
+                background-color: #4CAF50;
+                border: 2px solid #4CAF50;
+                image: none;
+            }}
+            QCheckBox#formatCheckBox::indicator:checked:hover {{
+                background-color: #45a049;
+                border: 2px solid #45a049;
+            }}
+        """
     
     def on_preset_color_changed(self, preset_name):
         """Handle preset color selection from combo box"""
         if preset_name == "Smart Colors...":
             return
             
-        if preset_name == "Auto":
-            # Determine color based on term content
+        if preset_name.startswith("Auto"):
+            # Determine color based on term content (the item reads "Auto (<color>)")
             self.bg_color = self.determine_smart_color()
-        elif preset_name in self.smart_colors:
-            color_hex = self.smart_colors[preset_name]
-            if color_hex:
-                self.bg_color = QColor(color_hex)
+        else:
+            preset_color = self.smart_colors.get(preset_name)
+            if preset_color is not None:
+                # Copy so the shared preset is never handed out
+                self.bg_color = QColor(preset_color)
         
         self.update_bg_color_button()
-        # Reset combo box to default
-        self.bg_preset_combo.setCurrentIndex(0)
+        # Reset combo box to default without running this handler again for it
+        combo = self.bg_preset_combo
+        if combo.currentIndex() != 0:
+            combo.blockSignals(True)
+            try:
+                combo.setCurrentIndex(0)
+            finally:
+                combo.blockSignals(False)
     
     def determine_smart_color(self):
         """Determine appropriate color based on term content"""
-        term_lower = self.term_edit.text().lower()
-        
         # Check for common log level patterns
-        if any(keyword in term_lower for keyword in ['error', 'err', 'fatal', 'critical', 'fail']):
-            return QColor('#FF4444')  # Red
-        elif any(keyword in term_lower for keyword in ['warning', 'warn', 'caution']):
-            return QColor('#FFA500')  # Orange
-        elif any(keyword in term_lower for keyword in ['success', 'complete', 'done', 'ok']):
-            return QColor('#28A745')  # Green
-        elif any(keyword in term_lower for keyword in ['info', 'information']):
-            return QColor('#4A90E2')  # Blue
-        elif any(keyword in term_lower for keyword in ['debug', 'trace', 'verbose']):
-            return QColor('#6C757D')  # Gray
-        else:
-            return QColor(100, 149, 237)  # Default cornflower blue
+        return _SMART_COLORS[smart_color_category(self.term_edit.text())]
     
     def on_term_text_changed(self):
         """Handle term text changes to suggest smart colors"""
-        # Update the "Auto" option in the combo box with suggested color info
-        suggested_color = self.determine_smart_color()
-        color_name = self.get_color_name(suggested_color)
-        
-        # Update the Auto option text to show the suggested color
-        auto_index = self.bg_preset_combo.findText("Auto")
-        if auto_index >= 0:
-            self.bg_preset_combo.setItemText(auto_index, f"Auto ({color_name})")
+        # Update the "Auto" option in the combo box with suggested color info; the
+        # label comes straight from the category, without a QColor round trip
+        color_name = _SMART_COLOR_LABELS[smart_color_category(self.term_edit.text())]
+        
+        # Update the Auto option text to show the suggested color, skipping the
+        # combo lookups entirely while the suggestion stays the same
+        auto_text = f"Auto ({color_name})"
+        if auto_text == self.auto_label:
+            return
+        self.auto_label = auto_text
+        combo = self.bg_preset_combo
+        auto_index = combo.findText("Auto", Qt.MatchFlag.MatchStartsWith)
+        if auto_index >= 0 and combo.itemText(auto_index) != auto_text:
+            # Relabeling must not look like a preset selection and reapply a color
+            combo.blockSignals(True)
+            try:
+                combo.setItemText(auto_index, auto_text)
+            finally:
+                combo.blockSignals(False)
     
     def get_color_name(self, color):
         """Get a human-readable name for a color"""
-        color_hex = color.name().upper()
-        color_map = {
-            '#FF4444': 'Red',
-            '#FFA500': 'Orange', 
-            '#28A745': 'Green',
-            '#4A90E2': 'Blue',
-            '#6C757D': 'Gray'
-        }
-        return color_map.get(color_hex, 'Default')
+        return _SMART_COLOR_NAMES.get(color.name().upper(), 'Default')
+    
+    def color_button_stylesheet(self, color):
+        """Get the stylesheet of a button filled with color, building it once per color and theme"""
+        color_name = color.name()
+        key = (color_name, self.theme_colors.border_color)
+        stylesheet = _COLOR_BUTTON_STYLE_CACHE.get(key)
+        if stylesheet is None:
+            # Same black/white text pick as highlighted terms, shared through the color cache
+            _, text_color = get_color(color_name)
+            stylesheet = _COLOR_BUTTON_STYLE_CACHE[key] = f"""
+                QPushButton {{
+                    background-color: {color_name};
+                    color: {text_color.name()};
+                    border: 1px solid {self.theme_colors.border_color};
+                    padding: 8px;
+                    border-radius: 3px;
+                }}
+                QPushButton:hover {{
+                    border: 2px solid {self.theme_colors.border_color};
+                }}
+            """
+        return stylesheet
     
     def update_bg_color_button(self):
         """Update the background color button appearance"""
-        self.bg_color_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.bg_color.name()};
-                color: {'#000000' if self.bg_color.lightness() > 128 else '#ffffff'};
-                border: 1px solid {self.theme_colors.border_color};
-                padding: 8px;
-                border-radius: 3px;
-            }}
-            QPushButton:hover {{
-                border: 2px solid {self.theme_colors.border_color};
-            }}
-        """)
+        # Setting an identical sheet would still make Qt parse it and repolish
+        stylesheet = self.color_button_stylesheet(self.bg_color)
+        if self.bg_color_btn.styleSheet() != stylesheet:
+            self.bg_color_btn.setStyleSheet(stylesheet)
     
     def choose_bg_color(self):
-        color = QColorDialog.getColor(self.bg_color, self, "Choose Background Color")
+        color = pick_color(self.bg_color, self, "Choose Background Color")
         if color.isValid():
             self.bg_color = color
             self.update_bg_color_button()
     
     def choose_text_color(self):
         initial_color = self.text_color if self.text_color else QColor(0, 0, 0)
-        color = QColorDialog.getColor(initial_color, self, "Choose Text Color")
+        color = pick_color(initial_color, self, "Choose Text Color")
         if color.isValid():
             self.text_color = color
             self.update_text_color_button()
@@ -1211,34 +1585,17 @@ class TermFormatDialog(QDialog):
         self.update_text_color_button()
     
     def update_text_color_button(self):
+        # Without a custom color the button is styled by the dialog's shared button
+        # rule; the property is set before setStyleSheet, which repolishes the button
+        self.text_color_btn.setProperty("autoColor", self.text_color is None)
         if self.text_color:
             self.text_color_btn.setText(f"Text Color: {self.text_color.name()}")
-            self.text_color_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {self.text_color.name()};
-                    color: {'#000000' if self.text_color.lightness() > 128 else '#ffffff'};
-                    border: 1px solid {self.theme_colors.border_color};
-                    padding: 8px;
-                    border-radius: 3px;
-                }}
-                QPushButton:hover {{
-                    border: 2px solid {self.theme_colors.border_color};
-                }}
-            """)
+            stylesheet = self.color_button_stylesheet(self.text_color)
         else:
             self.text_color_btn.setText("Auto Text Color")
-            self.text_color_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {self.theme_colors.button_bg};
-                    color: {self.theme_colors.button_text};
-                    border: 1px solid {self.theme_colors.border_color};
-                    padding: 8px;
-                    border-radius: 3px;
-                }}
-                QPushButton:hover {{
-                    background-color: {self.theme_colors.hover_color};
-                }}
-            """)
+            stylesheet = ""
+        if self.text_color_btn.styleSheet() != stylesheet:
+            self.text_color_btn.setStyleSheet(stylesheet)
     
     def apply_changes(self):
         """Apply the current formatting changes without closing the dialog"""
@@ -1266,65 +1623,48 @@ class ConfigDialog(QDialog):
         self.original_highlight_terms = [term.copy() if isinstance(term, dict) else term for term in self.highlight_terms]
         
         # Use parent's theme
-        if parent and hasattr(parent, 'current_theme_colors'):
-            self.theme_colors = parent.current_theme_colors
-        else:
-            self.theme_colors = get_theme_colors(ThemeMode.SYSTEM)
+        self.theme_colors = get_parent_theme_colors(parent)
+        
+        # The main window's highlighter and editor, looked up once since every
+        # preview, cancel and accept pushes terms to them
+        self.parent_highlighter = getattr(parent, 'highlighter', None)
+        self.parent_text_editor = getattr(parent, 'text_editor', None)
         
         # Set palette from theme
         palette = self.parent().palette() if parent else QPalette()
         self.setPalette(palette)
         
+        # One stylesheet for the whole dialog; children are matched by object name
+        # so the rules don't leak into the term format dialogs opened from here
+        self.setStyleSheet(get_dialog_stylesheet(self))
+        
         layout = QVBoxLayout(self)
         
         # Terms list
         self.terms_list = QListWidget()
-        self.terms_list.setStyleSheet(f"""
-            QListWidget {{
-                background-color: {self.theme_colors.base_bg};
-                color: {self.theme_colors.text_color};
-                border: 1px solid {self.theme_colors.border_color};
-            }}
-        """)
+        self.terms_list.setObjectName("termsList")
         self.update_terms_list()
         
         self.terms_label = QLabel("Highlight Terms:")
-        self.terms_label.setStyleSheet(f"color: {self.theme_colors.text_color};")
+        self.terms_label.setObjectName("termsLabel")
         layout.addWidget(self.terms_label)
         layout.addWidget(self.terms_list)
         
         # Buttons
         btn_layout = QHBoxLayout()
         
-        # Create themed button style
-        button_style = f"""
-            QPushButton {{
-                background-color: {self.theme_colors.button_bg};
-                color: {self.theme_colors.button_text};
-                border: 1px solid {self.theme_colors.border_color};
-                padding: 5px;
-                border-radius: 3px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.theme_colors.hover_color};
-            }}
-            QPushButton:pressed {{
-                background-color: {self.theme_colors.pressed_color};
-            }}
-        """
-        
         add_btn = QPushButton("Add Term")
-        add_btn.setStyleSheet(button_style)
+        add_btn.setObjectName("configButton")
         add_btn.clicked.connect(self.add_term)
         btn_layout.addWidget(add_btn)
         
         edit_btn = QPushButton("Edit Term")
-        edit_btn.setStyleSheet(button_style)
+        edit_btn.setObjectName("configButton")
         edit_btn.clicked.connect(self.edit_term)
         btn_layout.addWidget(edit_btn)
         
         remove_btn = QPushButton("Remove Term")
-        remove_btn.setStyleSheet(button_style)
+        remove_btn.setObjectName("configButton")
         remove_btn.clicked.connect(self.remove_term)
         btn_layout.addWidget(remove_btn)
         
@@ -1334,7 +1674,7 @@ class ConfigDialog(QDialog):
         config_btn_layout = QHBoxLayout()
         
         save_btn = QPushButton("Save Config")
-        save_btn.setStyleSheet(button_style)
+        save_btn.setObjectName("configButton")
         save_btn.clicked.connect(self.save_config)
         config_btn_layout.addWidget(save_btn)
         
@@ -1352,55 +1692,77 @@ class ConfigDialog(QDialog):
                 # Fallback to our constants
                 button_box = QDialogButtonBox(QtConstants.Ok | QtConstants.Cancel)
                 
-        button_box.setStyleSheet(button_style)
+        for button in button_box.buttons():
+            button.setObjectName("configButton")
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
+    def build_stylesheet(self):
+        """Build the dialog-wide stylesheet for the current theme"""
+        return f"""
+            QListWidget#termsList {{
+                background-color: {self.theme_colors.base_bg};
+                color: {self.theme_colors.text_color};
+                border: 1px solid {self.theme_colors.border_color};
+            }}
+            QLabel#termsLabel {{
+                color: {self.theme_colors.text_color};
+            }}
+            QPushButton#configButton {{
+                background-color: {self.theme_colors.button_bg};
+                color: {self.theme_colors.button_text};
+                border: 1px solid {self.theme_colors.border_color};
+                padding: 5px;
+                border-radius: 3px;
+            }}
+            QPushButton#configButton:hover {{
+                background-color: {self.theme_colors.hover_color};
+            }}
+            QPushButton#configButton:pressed {{
+                background-color: {self.theme_colors.pressed_color};
+            }}
+        """
+    
+    def format_term(self, term):
+        """Return the list entry text for a highlight term"""
+        if not isinstance(term, dict):
+            return term
+        # Collect the pieces and join once rather than growing the string per attribute
+        parts = [term['term']]
+        if 'color' in term:
+            parts.append(f" (Bg: {term['color']})")
+        if 'text_color' in term:
+            parts.append(f" (Text: {term['text_color']})")
+        if term.get('bold', False):
+            parts.append(" (Bold)")
+        if term.get('case_sensitive', False):
+            parts.append(" (Case Sensitive)")
+        return ''.join(parts)
+    
     def update_terms_list(self):
+        self.terms_list.setUpdatesEnabled(False)
         self.terms_list.clear()
-        for term in self.highlight_terms:
-            if isinstance(term, dict):
-                display_text = term['term']
-                if 'color' in term:
-                    display_text += f" (Bg: {term['color']})"
-                if 'text_color' in term:
-                    display_text += f" (Text: {term['text_color']})"
-                if term.get('bold', False):
-                    display_text += " (Bold)"
-                if term.get('case_sensitive', False):
-                    display_text += " (Case Sensitive)"
-                self.terms_list.addItem(display_text)
-            else:
-                self.terms_list.addItem(term)
+        self.terms_list.addItems([self.format_term(term) for term in self.highlight_terms])
+        self.terms_list.setUpdatesEnabled(True)
     
     def add_term(self):
         dialog = TermFormatDialog(self)
         
         # Connect apply signal to preview the changes
         dialog.applied.connect(lambda term_data: self.preview_term_changes(term_data, is_new=True))
-        # Store original state for restoration if dialog is cancelled
-        original_terms = [term.copy() if isinstance(term, dict) else term for term in self.highlight_terms]
-        dialog.finished.connect(lambda result: self.restore_on_cancel(result, original_terms) if result == 0 else None)
+        # Restore the highlighting if the dialog is cancelled
+        dialog.finished.connect(lambda result: self.restore_on_cancel(result) if result == 0 else None)
         
-        # Use try/except to handle different PyQt versions for dialog execution
-        try:
-            result = dialog.exec()
-        except AttributeError:
-            try:
-                result = dialog.exec_()
-            except AttributeError:
-                result = QtConstants.Rejected
-                print("Warning: Could not execute format dialog.")
+        result = _dialog_exec(dialog)
         
         if result == QtConstants.Accepted:
             term_data = dialog.get_result()
             if term_data['term']:  # Only add if term is not empty
                 self.highlight_terms.append(term_data)
-                self.update_terms_list()
+                self.terms_list.addItem(self.format_term(term_data))
                 # Apply changes to main window
-                if hasattr(self.parent(), 'highlighter') and hasattr(self.parent(), 'highlighter'):
-                    self.parent().highlighter.set_highlight_terms(self.highlight_terms)
+                self.apply_terms_to_parent(self.highlight_terms)
     
     def edit_term(self):
         current_row = self.terms_list.currentRow()
@@ -1425,28 +1787,29 @@ class ConfigDialog(QDialog):
             
             # Connect apply signal to preview the changes
             dialog.applied.connect(lambda term_data: self.preview_term_changes(term_data, is_new=False, index=current_row))
-            # Store original state for restoration if dialog is cancelled
-            original_terms = [term.copy() if isinstance(term, dict) else term for term in self.highlight_terms]
-            dialog.finished.connect(lambda result: self.restore_on_cancel(result, original_terms) if result == 0 else None)
+            # Restore the highlighting if the dialog is cancelled
+            dialog.finished.connect(lambda result: self.restore_on_cancel(result) if result == 0 else None)
             
-            # Use try/except to handle different PyQt versions for dialog execution
-            try:
-                result = dialog.exec()
-            except AttributeError:
-                try:
-                    result = dialog.exec_()
-                except AttributeError:
-                    result = QtConstants.Rejected
-                    print("Warning: Could not execute format dialog.")
+            result = _dialog_exec(dialog)
             
             if result == QtConstants.Accepted:
                 term_data = dialog.get_result()
                 if term_data['term']:  # Only update if term is not empty
                     self.highlight_terms[current_row] = term_data
-                    self.update_terms_list()
+                    # Only touch the edited row, and only if its label actually changed
+                    item = self.terms_list.item(current_row)
+                    display_text = self.format_term(term_data)
+                    if item.text() != display_text:
+                        item.setText(display_text)
                     # Apply changes to main window
-                    if hasattr(self.parent(), 'highlighter') and hasattr(self.parent(), 'highlighter'):
-                        self.parent().highlighter.set_highlight_terms(self.highlight_terms)
+                    self.apply_terms_to_parent(self.highlight_terms)
+    
+    def apply_terms_to_parent(self, terms, repaint=False):
+        """Highlight terms in the main window, optionally repainting the editor right away"""
+        if self.parent_highlighter is not None:
+            self.parent_highlighter.set_highlight_terms(terms)
+            if repaint and self.parent_text_editor is not None:
+                self.parent_text_editor.update()
     
     def preview_term_changes(self, term_data, is_new=False, index=None):
         """Preview term changes in the main window without permanently saving them"""
@@ -1464,43 +1827,33 @@ class ConfigDialog(QDialog):
             if index is not None and 0 <= index < len(preview_terms):
                 preview_terms[index] = term_data
         
-        # Apply preview to main window highlighter
-        if hasattr(self.parent(), 'highlighter'):
-            self.parent().highlighter.set_highlight_terms(preview_terms)
-            # Force a repaint to show the changes immediately
-            if hasattr(self.parent(), 'text_editor'):
-                self.parent().text_editor.update()
+        # Apply preview to main window highlighter, repainting to show the changes immediately
+        self.apply_terms_to_parent(preview_terms, repaint=True)
     
     def reject(self):
         """Override reject to restore original highlighting when cancelled"""
-        # Restore original highlighting
-        if hasattr(self.parent(), 'highlighter'):
-            self.parent().highlighter.set_highlight_terms(self.original_highlight_terms)
-            # Force a repaint to show the restored highlighting
-            if hasattr(self.parent(), 'text_editor'):
-                self.parent().text_editor.update()
+        # Restore original highlighting and repaint to show it
+        self.apply_terms_to_parent(self.original_highlight_terms, repaint=True)
         super().reject()
     
     def accept(self):
         """Override accept to ensure final changes are applied"""
         # Apply final changes to main window
-        if hasattr(self.parent(), 'highlighter'):
-            self.parent().highlighter.set_highlight_terms(self.highlight_terms)
+        self.apply_terms_to_parent(self.highlight_terms)
         super().accept()
     
-    def restore_on_cancel(self, result, original_terms):
+    def restore_on_cancel(self, result):
         """Restore highlighting when TermFormatDialog is cancelled"""
+        # Previews only ever highlight a copy of the terms, so self.highlight_terms
+        # still holds the state from before the dialog opened
         if result == 0:  # Dialog was rejected/cancelled
-            if hasattr(self.parent(), 'highlighter'):
-                self.parent().highlighter.set_highlight_terms(original_terms)
-                if hasattr(self.parent(), 'text_editor'):
-                    self.parent().text_editor.update()
+            self.apply_terms_to_parent(self.highlight_terms, repaint=True)
     
     def remove_term(self):
         current_row = self.terms_list.currentRow()
         if current_row >= 0:
             del self.highlight_terms[current_row]
-            self.update_terms_list()
+            self.terms_list.takeItem(current_row)
     
     def save_config(self):
         # Default to user's home directory with standard config filename
@@ -1519,8 +1872,13 @@ class ConfigDialog(QDialog):
             
             try:
                 config = {'highlight_terms': self.highlight_terms}
-                with open(file_name, 'w', encoding='utf-8') as f:
-                    yaml.dump(config, f, default_flow_style=False)
+                yaml, _, SafeDumper = load_yaml_module()
+                # Emit the whole document in one go, as save_app_config does, rather
+                # than streaming many small writes through a text wrapper
+                config_data = yaml.dump(config, Dumper=SafeDumper, default_flow_style=False, encoding='utf-8')
+                with open(file_name, 'wb') as f:
+                    f.write(config_data)
+                invalidate_config_cache(file_name)
                 QMessageBox.information(self, "Success", f"Configuration saved to {file_name}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save configuration: {str(e)}")
@@ -1534,10 +1892,7 @@ class BookmarkListDialog(QDialog):
         self.selected_bookmark = None
         
         # Use parent's theme
-        if parent and hasattr(parent, 'current_theme_colors'):
-            self.theme_colors = parent.current_theme_colors
-        else:
-            self.theme_colors = get_theme_colors(ThemeMode.SYSTEM)
+        self.theme_colors = get_parent_theme_colors(parent)
         
         layout = QVBoxLayout(self)
         
@@ -1558,13 +1913,19 @@ class BookmarkListDialog(QDialog):
             }}
         """)
         
-        # Populate bookmark list
+        # Every row is a single line of text, so the view can size one row and
+        # skip asking each item for its size hint
+        self.bookmark_list.setUniformItemSizes(True)
+        
+        # Populate bookmark list; nothing is connected to the list yet and it is
+        # not shown, so items go straight in without signal or paint work
+        add_item = self.bookmark_list.addItem
+        user_role = Qt.ItemDataRole.UserRole
         for bookmark in self.bookmarks:
-            line_content = bookmark['content'][:60]  # Limit display length
-            item_text = f"Line {bookmark['line']:4d}: {line_content}"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.ItemDataRole.UserRole, bookmark)  # Store bookmark data
-            self.bookmark_list.addItem(item)
+            # Line content is limited to 60 characters for display
+            item = QListWidgetItem(f"Line {bookmark['line']:4d}: {bookmark['content'][:60]}")
+            item.setData(user_role, bookmark)  # Store bookmark data
+            add_item(item)
         
         # Handle double-click to navigate
         self.bookmark_list.itemDoubleClicked.connect(self.on_bookmark_double_clicked)
@@ -1674,15 +2035,115 @@ class WorkerSignals(QObject):
     error = pyqtSignal(str)
     result = pyqtSignal(object)
     progress = pyqtSignal(int)
-    chunk_ready = pyqtSignal(str, int, int)  # text, chunk_number, total_chunks
+    
+    def __init__(self, max_pending_chunks=8):
+        super().__init__()
+        # Chunks read but not yet displayed as (text, chunk_number, total_chunks),
+        # drained by the UI on a timer
+        self.pending_chunks = collections.deque()
+        # Bounds pending_chunks so a fast disk can't outrun the display
+        self.chunk_slots = threading.Semaphore(max_pending_chunks)
+        self.cancelled = threading.Event()
+        # Number of leading lines the worker skipped, set before the first chunk is queued
+        self.skipped_lines = 0
 
 # FileLoaderWorker class to handle file loading in a separate thread
 class FileLoaderWorker(QRunnable):
-    def __init__(self, file_path, chunk_size=256*1024):  # Reduced chunk size to 256KB
+    def __init__(self, file_path, chunk_size=2*1024*1024, max_lines=None):  # 2MB chunks keep read/emit counts low
         super().__init__()
         self.file_path = file_path
         self.signals = WorkerSignals()
         self.chunk_size = chunk_size
+        # Only the last max_lines lines are loaded, matching what the editor can keep
+        self.max_lines = max_lines
+    
+    def queue_chunk(self, chunk, chunk_number, total_chunks):
+        """Hand a chunk to the UI, waiting while too many are still undisplayed"""
+        while not self.signals.chunk_slots.acquire(timeout=0.1):
+            if self.signals.cancelled.is_set():
+                return False
+        self.signals.pending_chunks.append((chunk, chunk_number, total_chunks))
+        return True
+    
+    def detect_encoding(self, head):
+        """Pick the file encoding from its BOM or from a sample of its first bytes"""
+        if head.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'utf-16'
+        try:
+            # Incremental decode so a character cut off at the end of the sample is ignored
+            codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            # Not UTF-8, assume a Windows code page
+            return 'cp1252'
+        
+    def find_tail_offset(self, f, file_size):
+        """Return the offset of the last max_lines newline-terminated lines plus any text after them, or 0"""
+        if not file_size:
+            return 0
+        # Map the file so only the pages holding the tail are read, and step back one
+        # newline at a time without copying blocks into Python bytes objects
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            pos = file_size
+            # The newline ending the last line that won't be kept
+            for _ in range(self.max_lines + 1):
+                pos = mapped.rfind(b'\n', 0, pos)
+                if pos == -1:
+                    return 0
+            return pos + 1
+    
+    def locate_tail(self, f, file_size):
+        """Return (start offset, skipped line count) for the last max_lines lines of the file"""
+        # Counting the skipped lines reads the whole head of the file, so the result is
+        # remembered on disk per file version and reused when the same log is reopened
+        cache_path = get_cache_path('tail_offsets.json')
+        file_stat = os.fstat(f.fileno())
+        key = f"{os.path.abspath(self.file_path)}|{file_stat.st_mtime_ns}|{file_size}|{self.max_lines}"
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as cache_file:
+                cache = json.load(cache_file)
+        except (OSError, ValueError):
+            cache = {}
+        if key in cache:
+            start_offset, skipped_lines = cache[key]
+            return start_offset, skipped_lines
+        
+        start_offset = self.find_tail_offset(f, file_size)
+        if not start_offset:
+            return 0, 0
+        skipped_lines = self.count_lines(f, start_offset)
+        
+        # Keep entries for the 64 most recently opened large files
+        cache[key] = [start_offset, skipped_lines]
+        while len(cache) > 64:
+            del cache[next(iter(cache))]
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            temp_path = cache_path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass  # The cache is optional
+        return start_offset, skipped_lines
+    
+    def count_lines(self, f, end):
+        """Count the newlines in the first end bytes of the file"""
+        f.seek(0)
+        count = 0
+        remaining = end
+        # Reuse one buffer instead of allocating a new bytes object per block
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        while remaining > 0:
+            read_size = f.readinto(view[:min(self.chunk_size, remaining)])
+            if not read_size:
+                break
+            count += buffer.count(b'\n', 0, read_size)
+            remaining -= read_size
+        return count
         
     @pyqtSlot()
     def run(self):
@@ -1690,69 +2151,64 @@ class FileLoaderWorker(QRunnable):
             # Get file size for progress calculation
             file_size = os.path.getsize(self.file_path)
             
-            # Count total chunks for progress reporting
-            total_chunks = (file_size // self.chunk_size) + (1 if file_size % self.chunk_size else 0)
-            
-            # Try different encodings for Windows compatibility
-            encodings = ['utf-8', 'utf-16', 'cp1252', 'latin-1']
-            file_opened = False
-            
-            for encoding in encodings:
-                try:
-                    with open(self.file_path, 'r', encoding=encoding, errors='replace') as f:
-                        bytes_read = 0
-                        chunk_number = 0
-                        
-                        while True:
-                            chunk = f.read(self.chunk_size)
-                            if not chunk:
-                                break
-                                
-                            chunk_number += 1
-                            bytes_read += len(chunk.encode('utf-8'))
-                            progress = int((bytes_read / file_size) * 100)
-                            
-                            # Emit the chunk for immediate display
-                            self.signals.chunk_ready.emit(chunk, chunk_number, total_chunks)
-                            
-                            # Emit progress update
-                            self.signals.progress.emit(progress)
-                            
-                            # Small sleep to allow UI updates
-                            time.sleep(0.01)
-                        
-                        file_opened = True
+            # Unbuffered, so each read is a single read() syscall straight into the
+            # chunk (with the GIL released) instead of passing through BufferedReader
+            with open(self.file_path, 'rb', buffering=0) as f:
+                # Ask the kernel for aggressive read-ahead where supported (Linux)
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+                
+                # Detect the encoding once, then decode chunks in a single pass
+                encoding = self.detect_encoding(f.read(64 * 1024))
+                
+                # Lines beyond the editor's block limit would be inserted only to be
+                # evicted again, so start reading at the tail the editor will keep.
+                # Newlines are single bytes in every detected encoding except UTF-16.
+                start_offset = 0
+                if self.max_lines and encoding != 'utf-16':
+                    start_offset, self.signals.skipped_lines = self.locate_tail(f, file_size)
+                
+                f.seek(start_offset)
+                decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+                
+                # Count total chunks for progress reporting
+                remaining_size = file_size - start_offset
+                total_chunks = (remaining_size // self.chunk_size) + (1 if remaining_size % self.chunk_size else 0)
+                
+                bytes_read = start_offset
+                chunk_number = 0
+                last_progress = -1
+                
+                while True:
+                    chunk_bytes = f.read(self.chunk_size)
+                    if not chunk_bytes:
                         break
-                        
-                except UnicodeDecodeError:
-                    continue
-            
-            if not file_opened:
-                # Fallback to binary mode if all encodings fail
-                with open(self.file_path, 'rb') as f:
-                    bytes_read = 0
-                    chunk_number = 0
                     
-                    while True:
-                        chunk_bytes = f.read(self.chunk_size)
-                        if not chunk_bytes:
-                            break
-                            
-                        # Decode bytes to string, replacing invalid characters
-                        chunk = chunk_bytes.decode('utf-8', errors='replace')
-                        
-                        chunk_number += 1
-                        bytes_read += len(chunk_bytes)
-                        progress = int((bytes_read / file_size) * 100)
-                        
-                        # Emit the chunk for immediate display
-                        self.signals.chunk_ready.emit(chunk, chunk_number, total_chunks)
-                        
-                        # Emit progress update
+                    # Multi-byte characters split across chunks are carried over by the decoder
+                    chunk = decoder.decode(chunk_bytes)
+                    
+                    chunk_number += 1
+                    bytes_read += len(chunk_bytes)
+                    # A log still being written can grow past the size taken above,
+                    # including one that was still empty when it was taken
+                    progress = min(100, bytes_read * 100 // file_size) if file_size else 100
+                    
+                    # Queue the chunk for display
+                    if not self.queue_chunk(chunk, chunk_number, total_chunks):
+                        return
+                    
+                    # Emit progress update only when the percentage actually moves
+                    if progress != last_progress:
+                        last_progress = progress
                         self.signals.progress.emit(progress)
-                        
-                        # Small sleep to allow UI updates
-                        time.sleep(0.01)
+                
+                # Flush any trailing partial character
+                tail = decoder.decode(b'', final=True)
+                if tail and not self.queue_chunk(tail, chunk_number, total_chunks):
+                    return
             
             # Signal completion
             self.signals.finished.emit()
@@ -1760,69 +2216,102 @@ class FileLoaderWorker(QRunnable):
         except Exception as e:
             self.signals.error.emit(str(e))
 
-# Optimized text editor that efficiently handles large files
+# SearchWorker class to scan the document text in a separate thread
+class SearchWorker(QRunnable):
+    def __init__(self, text, term, lower_text=False):
+        super().__init__()
+        self.text = text
+        self.term = term
+        # Case-insensitive searches pass the original text and a lowered term
+        self.lower_text = lower_text
+        self.signals = WorkerSignals()
+    
+    @pyqtSlot()
+    def run(self):
+        try:
+            search_text = self.text.lower() if self.lower_text else self.text
+            if self.signals.cancelled.is_set():
+                return
+            
+            term_pattern = re.compile(re.escape(self.term))
+            matches = [match.start() for match in term_pattern.finditer(search_text)]
+            
+            if not self.signals.cancelled.is_set():
+                self.signals.result.emit((search_text, matches))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+# Optimized text editor that efficiently handles large files. Logs are shown in a
+# QPlainTextEdit colored by LogHighlighter; rich-text widgets like QTextEdit and
+# QTextBrowser lay out every block as HTML and are kept to small static pages.
+# Being read-only also keeps the document's undo stack disabled.
 class OptimizedTextEdit(QPlainTextEdit):
+    # Upper bound on lines kept in the document. Every block carries its own
+    # layout data, so memory and relayout cost grow with the block count; once
+    # the limit is reached Qt drops blocks from the top. The file loader skips
+    # straight to the tail of longer files instead of inserting lines that would
+    # be dropped again.
+    MAX_BLOCKS = 100000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setReadOnly(True)
         self.main_window = parent  # Store reference to main window
         
-        # Use try/except to handle different PyQt versions
-        try:
-            # Try with enum if available
-            self.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
-        except (AttributeError, TypeError):
-            try:
-                # Try with direct enum access
-                self.setLineWrapMode(QPlainTextEdit.NoWrap)
-            except (AttributeError, TypeError):
-                # Fallback to function with no args (some PyQt versions default to NoWrap)
-                print("Warning: Could not set line wrap mode, using default.")
+        self.setLineWrapMode(_NO_WRAP)
         
         # Optimize display settings
-        self.document().setMaximumBlockCount(100000)  # Limit maximum blocks for performance
-        
+        self.document().setMaximumBlockCount(self.MAX_BLOCKS)
+        
+        # Text queued by append_text, inserted in one batch by flush_pending_text
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self.flush_pending_text)
+    
     def append_text(self, text):
-        """Append text more efficiently with ANSI processing"""
-        cursor = self.textCursor()
+        """Queue text for appending; appends within 50ms are inserted together"""
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def clear(self):
+        """Clear the document and drop any text still waiting to be inserted"""
+        self._flush_timer.stop()
+        self._pending.clear()
+        super().clear()
+        
+    def flush_pending_text(self):
+        """Append all queued text in a single pass with ANSI processing"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        text = ''.join(self._pending)
+        self._pending.clear()
         
-        # Use try/except to handle different PyQt versions
-        try:
-            cursor.movePosition(QtConstants.MoveEnd)  # Use our constant
-        except (AttributeError, TypeError):
-            try:
-                # Try with enum
-                cursor.movePosition(QTextCursor.End)
-            except (AttributeError, TypeError):
-                # Try with MoveOperation enum
-                try:
-                    cursor.movePosition(QTextCursor.MoveOperation.End)
-                except (AttributeError, TypeError):
-                    print("Warning: Could not move cursor to end.")
+        # No repaint can happen before this slot returns, so the batch is inserted
+        # without toggling setUpdatesEnabled (re-enabling forces a full repaint).
+        # One edit block makes the document report a single change for the whole
+        # batch instead of one per ANSI segment, so layout and highlighting run once.
+        cursor = self.textCursor()
+        cursor.movePosition(_MOVE_END)
+        cursor.beginEditBlock()
         
         # Process ANSI colors if enabled (check if main_window exists and has ANSI enabled)
         if (self.main_window and 
             hasattr(self.main_window, 'ansi_processing_enabled') and 
             self.main_window.ansi_processing_enabled):
-            # Debug: Check if we're taking the ANSI processing path
-            if '\x1b[' in text or '\033[' in text:
-                print(f"ANSI processing path: processing text with ANSI codes")
             self.append_text_with_ansi(text, cursor)
         else:
-            # Debug: Check why ANSI processing isn't enabled
-            if self.main_window:
-                print(f"ANSI processing disabled: enabled={getattr(self.main_window, 'ansi_processing_enabled', 'MISSING')}")
-            else:
-                print("ANSI processing disabled: no main_window reference")
             # Just clean and insert text
             clean_text = self.clean_text_basic(text)
             if clean_text:
                 cursor.insertText(clean_text)
+        cursor.endEditBlock()
         
-        # Limit text updates for better performance
-        self.setUpdatesEnabled(False)
+        # Keep the view following the end of the log while it loads
         self.setTextCursor(cursor)
-        self.setUpdatesEnabled(True)
     
     def clean_text(self, text):
         """Clean text of problematic characters and escape sequences"""
@@ -1830,42 +2319,20 @@ class OptimizedTextEdit(QPlainTextEdit):
             return text
             
         # Remove ANSI escape sequences that weren't parsed
-        import re
-        
-        # Remove various ANSI escape sequences
         # Color sequences: \x1b[0m, \x1b[31m, etc.
-        ansi_color = re.compile(r'\x1b\[[0-9;]*m')
-        text = ansi_color.sub('', text)
+        text = _ANSI_ESC_SGR_RE.sub('', text)
         
         # Cursor movement: \x1b[H, \x1b[2J, etc. 
-        ansi_cursor = re.compile(r'\x1b\[[0-9;]*[ABCDHJKfhl]')
-        text = ansi_cursor.sub('', text)
+        text = _ANSI_CURSOR_RE.sub('', text)
         
         # Other escape sequences
-        ansi_other = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
-        text = ansi_other.sub('', text)
+        text = _ANSI_OTHER_RE.sub('', text)
         
         # Remove bare escape characters
         text = text.replace('\x1b', '')
         
         # Handle problematic Unicode characters (actual Unicode, not escaped)
-        problematic_chars = {
-            '\u202a': '',  # Left-to-right embedding
-            '\u202b': '',  # Right-to-left embedding  
-            '\u202c': '',  # Pop directional formatting
-            '\u202d': '',  # Left-to-right override
-            '\u202e': '',  # Right-to-left override
-            '\u200b': '',  # Zero-width space
-            '\u200c': '',  # Zero-width non-joiner
-            '\u200d': '',  # Zero-width joiner
-            '\u2060': '',  # Word joiner
-            '\ufeff': '',  # Zero-width no-break space (BOM)
-            '\u2028': '\n',  # Line separator -> normal newline
-            '\u2029': '\n',  # Paragraph separator -> normal newline
-        }
-        
-        for char, replacement in problematic_chars.items():
-            text = text.replace(char, replacement)
+        text = text.translate(_UNICODE_CLEANUP)
         
         # Normalize Unicode to remove combining characters that might cause issues
         try:
@@ -1881,58 +2348,32 @@ class OptimizedTextEdit(QPlainTextEdit):
         if not text:
             return text
         
-        import re
-        
         # Remove ANSI escape sequences (both \x1b[...m and [...m formats)
-        ansi_escape = re.compile(r'(\x1b)?\[([0-9;]*)m')
-        text = ansi_escape.sub('', text)
+        text = _ANSI_SGR_RE.sub('', text)
         
         # Remove other escape sequences
-        ansi_other = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]')
-        text = ansi_other.sub('', text)
+        text = _ANSI_OTHER_RE.sub('', text)
         
         # Remove problematic Unicode directional formatting
-        text = text.replace('\u202a', '')  # Left-to-right embedding 
-        text = text.replace('\u202c', '')  # Pop directional formatting
+        text = text.translate(_DIRECTIONAL_CLEANUP)
         
         return text
     
     def append_text_with_ansi(self, text, cursor):
         """Append text with simple ANSI color processing"""
-        import re
-        
-        # Define colors directly here for safety
-        ansi_colors = {
-            30: QColor(0, 0, 0),        # Black
-            31: QColor(255, 0, 0),      # Red
-            32: QColor(0, 255, 0),      # Green  
-            33: QColor(255, 255, 0),    # Yellow
-            34: QColor(0, 0, 255),      # Blue
-            35: QColor(255, 0, 255),    # Magenta
-            36: QColor(0, 255, 255),    # Cyan
-            37: QColor(255, 255, 255),  # White
-            90: QColor(128, 128, 128),  # Bright Black (Gray)
-            91: QColor(255, 128, 128),  # Bright Red
-            92: QColor(128, 255, 128),  # Bright Green
-            93: QColor(255, 255, 128),  # Bright Yellow
-            94: QColor(128, 128, 255),  # Bright Blue
-            95: QColor(255, 128, 255),  # Bright Magenta
-            96: QColor(128, 255, 255),  # Bright Cyan
-            97: QColor(255, 255, 255),  # Bright White
-        }
+        # Text without any escape sequence is inserted as-is with the current
+        # formatting, which is all the loop below would do for it
+        if '\x1b[' not in text:
+            clean_text = self.clean_unicode_only(text)
+            if clean_text:
+                cursor.insertText(clean_text)
+            return
         
         # Simple approach: handle the most common ANSI codes safely
         # Match ESC character (ASCII 27) followed by [ and color codes
-        ansi_pattern = re.compile(r'\x1b\[([0-9;]*)m')
-        
-        # Debug: Check what we found
-        matches = list(ansi_pattern.finditer(text))
-        if matches:
-            print(f"Found {len(matches)} ANSI matches in: {text[:50]}...")
-        
         last_end = 0
         
-        for match in matches:
+        for match in _ANSI_SGR_CODES_RE.finditer(text):
             # Insert text before ANSI code with current formatting
             if match.start() > last_end:
                 text_segment = text[last_end:match.start()]
@@ -1941,36 +2382,8 @@ class OptimizedTextEdit(QPlainTextEdit):
                     if clean_segment:
                         cursor.insertText(clean_segment)
             
-            # Parse the ANSI code for colors and formatting
-            code = match.group(1)
-            if code:
-                try:
-                    # Split compound codes like "0;32" into individual codes
-                    codes = [int(c) for c in code.split(';') if c.strip()]
-                    format_obj = QTextCharFormat()
-                    
-                    # Process each code
-                    for color_code in codes:
-                        if color_code == 0:
-                            # Reset formatting
-                            format_obj = QTextCharFormat()
-                        elif color_code == 1:
-                            # Bold
-                            try:
-                                format_obj.setFontWeight(QFont.Weight.Bold)
-                            except AttributeError:
-                                format_obj.setFontWeight(700)
-                        elif color_code in ansi_colors:
-                            # Apply color
-                            format_obj.setForeground(ansi_colors[color_code])
-                    
-                    cursor.setCharFormat(format_obj)
-                except (ValueError, IndexError, AttributeError):
-                    # If parsing fails, just continue without color
-                    cursor.setCharFormat(QTextCharFormat())
-            else:
-                # Empty code means reset
-                cursor.setCharFormat(QTextCharFormat())
+            # Apply the colors and formatting of the ANSI code
+            cursor.setCharFormat(get_ansi_format(match.group(1)))
             
             last_end = match.end()
         
@@ -1988,23 +2401,7 @@ class OptimizedTextEdit(QPlainTextEdit):
             return text
         
         # Handle problematic Unicode characters (actual Unicode, not escaped)
-        problematic_chars = {
-            '\u202a': '',  # Left-to-right embedding
-            '\u202b': '',  # Right-to-left embedding  
-            '\u202c': '',  # Pop directional formatting
-            '\u202d': '',  # Left-to-right override
-            '\u202e': '',  # Right-to-left override
-            '\u200b': '',  # Zero-width space
-            '\u200c': '',  # Zero-width non-joiner
-            '\u200d': '',  # Zero-width joiner
-            '\u2060': '',  # Word joiner
-            '\ufeff': '',  # Zero-width no-break space (BOM)
-            '\u2028': '\n',  # Line separator -> normal newline
-            '\u2029': '\n',  # Paragraph separator -> normal newline
-        }
-        
-        for char, replacement in problematic_chars.items():
-            text = text.replace(char, replacement)
+        text = text.translate(_UNICODE_CLEANUP)
         
         # Normalize Unicode to remove combining characters that might cause issues
         try:
@@ -2027,7 +2424,7 @@ class OptimizedTextEdit(QPlainTextEdit):
         menu = QMenu(self)
         
         # Check if current line is bookmarked
-        is_bookmarked = any(bookmark['line'] == line_number for bookmark in self.main_window.bookmarks)
+        is_bookmarked = line_number in self.main_window.bookmark_lines
         
         if is_bookmarked:
             action = menu.addAction("Remove Bookmark")
@@ -2058,6 +2455,12 @@ class LogViewer(QMainWindow):
         self.setGeometry(100, 100, 1000, 700)  # Larger default window
         self.search_results = []
         self.current_search_index = -1
+        # Document text (and its lowered form) kept for searching until the document changes
+        self.plain_text_cache = None
+        self.lowered_text_cache = None
+        self.search_results_cache = collections.OrderedDict()  # (case_sensitive, term) -> match positions
+        self.search_text_version = 0  # Bumped on every text change, so stale background scans are ignored
+        self.search_signals = None  # Signals of the background search in progress
         self.search_highlight_format = QTextCharFormat()
         self.search_highlight_format.setBackground(QColor(255, 255, 0))
         self.search_highlight_format.setForeground(QColor(0, 0, 0))
@@ -2065,6 +2468,7 @@ class LogViewer(QMainWindow):
         # Store the current highlighted line positions for clearing
         self.current_highlight_start = None
         self.current_highlight_end = None
+        self.current_highlight_formats = []  # (position, length, format) of the line's own text
         
         self.current_font_size = 12
         self.ansi_parser = AnsiColorParser()
@@ -2072,7 +2476,8 @@ class LogViewer(QMainWindow):
         self.highlight_terms = []
         self.loading_file = False
         self.current_file = None
-        self.total_content = ""
+        self.help_dialog = None  # Kept between opens, see reuse_themed_dialog
+        self.about_dialog = None
         
         # Line wrap state
         self.line_wrap_enabled = False
@@ -2080,9 +2485,11 @@ class LogViewer(QMainWindow):
         # Line numbers state
         self.line_numbers_enabled = False
         self.current_line_number = 1  # Track current line number for chunk processing
+        self.skipped_lines = 0  # Leading lines not loaded because the file exceeds the editor limit
         
         # Bookmark system
         self.bookmarks = []  # List of bookmark dictionaries with line numbers and content
+        self.bookmark_lines = set()  # Line numbers of self.bookmarks, synced by update_bookmark_highlights
         self.current_bookmark_index = -1  # Current bookmark for navigation
         self.bookmark_highlight_color = "#64C8FF"  # Default light blue color (100, 200, 255)
         self.bookmark_highlight_format = QTextCharFormat()
@@ -2093,14 +2500,23 @@ class LogViewer(QMainWindow):
         
         # ANSI processing system
         self.ansi_processing_enabled = True  # Enable ANSI color processing by default
+        self.large_file_highlighting_enabled = False  # Highlight documents over LogHighlighter.MAX_HIGHLIGHT_CHARS
+        self.highlighting_suspended = False  # Highlighter detached because the document is too large
         
         # Theme system
         self.current_theme_mode = ThemeMode.SYSTEM
         self.current_theme_colors = get_theme_colors(self.current_theme_mode)
+        self._applied_window_colors = None  # Theme colors of the last window stylesheet set
         
         # Initialize thread pool for background tasks
         self.threadpool = QThreadPool()
         print(f"Maximum thread count: {self.threadpool.maxThreadCount()}")
+        
+        # Display chunks queued by the file loader at roughly screen refresh rate
+        self.loader_signals = None
+        self.chunk_drain_timer = QTimer()
+        self.chunk_drain_timer.setInterval(16)
+        self.chunk_drain_timer.timeout.connect(self.drain_pending_chunks)
 
         # Create menu bar
         self.create_menu_bar()
@@ -2114,6 +2530,7 @@ class LogViewer(QMainWindow):
 
         # Create optimized text editor
         self.text_editor = OptimizedTextEdit(self)
+        self.text_editor.document().contentsChange.connect(self.invalidate_search_text)
         # Style will be applied by theme system
         layout.addWidget(self.text_editor)
         
@@ -2125,6 +2542,7 @@ class LogViewer(QMainWindow):
 
         # Initialize the highlighter
         self.highlighter = LogHighlighter(self.text_editor.document())
+        self.highlighter.view = self.text_editor
         # Set initial bookmark format
         self.highlighter.update_bookmark_format(self.bookmark_highlight_format)
 
@@ -2132,7 +2550,6 @@ class LogViewer(QMainWindow):
         search_layout = QHBoxLayout()
         
         search_label = QLabel("Search:")
-        search_label.setStyleSheet("color: white;")
         search_layout.addWidget(search_label)
         
         self.search_input = QLineEdit()
@@ -2143,59 +2560,14 @@ class LogViewer(QMainWindow):
         search_layout.addWidget(self.search_input)
         
         find_button = QPushButton("Find")
-        find_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3f3f3f;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4f4f4f;
-            }
-            QPushButton:pressed {
-                background-color: #2f2f2f;
-            }
-        """)
         find_button.clicked.connect(self.find_first)
         search_layout.addWidget(find_button)
 
         find_prev_button = QPushButton("Find Previous")
-        find_prev_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3f3f3f;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4f4f4f;
-            }
-            QPushButton:pressed {
-                background-color: #2f2f2f;
-            }
-        """)
         find_prev_button.clicked.connect(self.find_previous)
         search_layout.addWidget(find_prev_button)
 
         find_next_button = QPushButton("Find Next")
-        find_next_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3f3f3f;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4f4f4f;
-            }
-            QPushButton:pressed {
-                background-color: #2f2f2f;
-            }
-        """)
         find_next_button.clicked.connect(self.find_next)
         search_layout.addWidget(find_next_button)
         
@@ -2211,73 +2583,24 @@ class LogViewer(QMainWindow):
         # Add font size controls
         font_size_layout = QHBoxLayout()
         font_size_label = QLabel("Font Size:")
-        font_size_label.setStyleSheet("color: white;")
         font_size_layout.addWidget(font_size_label)
         
         decrease_font_button = QPushButton("-")
-        decrease_font_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3f3f3f;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-                min-width: 30px;
-            }
-            QPushButton:hover {
-                background-color: #4f4f4f;
-            }
-            QPushButton:pressed {
-                background-color: #2f2f2f;
-            }
-        """)
+        decrease_font_button.setObjectName("fontSizeButton")
         decrease_font_button.clicked.connect(self.decrease_font_size)
         font_size_layout.addWidget(decrease_font_button)
         
         self.font_size_display = QLabel("12")
-        self.font_size_display.setStyleSheet("""
-            color: white;
-            padding: 0 10px;
-        """)
+        self.font_size_display.setObjectName("fontSizeDisplay")
         font_size_layout.addWidget(self.font_size_display)
         
         increase_font_button = QPushButton("+")
-        increase_font_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3f3f3f;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-                min-width: 30px;
-            }
-            QPushButton:hover {
-                background-color: #4f4f4f;
-            }
-            QPushButton:pressed {
-                background-color: #2f2f2f;
-            }
-        """)
+        increase_font_button.setObjectName("fontSizeButton")
         increase_font_button.clicked.connect(self.increase_font_size)
         font_size_layout.addWidget(increase_font_button)
         
         # Add configuration button
         config_button = QPushButton("Configure Highlighting")
-        config_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3f3f3f;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4f4f4f;
-            }
-            QPushButton:pressed {
-                background-color: #2f2f2f;
-            }
-        """)
         config_button.clicked.connect(self.configure_highlighting)
         font_size_layout.addWidget(config_button)
         
@@ -2287,40 +2610,10 @@ class LogViewer(QMainWindow):
         file_layout = QHBoxLayout()
         
         open_button = QPushButton("Open Log File")
-        open_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3f3f3f;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4f4f4f;
-            }
-            QPushButton:pressed {
-                background-color: #2f2f2f;
-            }
-        """)
         open_button.clicked.connect(self.open_file)
         file_layout.addWidget(open_button)
         
         load_config_button = QPushButton("Load Config")
-        load_config_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3f3f3f;
-                color: white;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #4f4f4f;
-            }
-            QPushButton:pressed {
-                background-color: #2f2f2f;
-            }
-        """)
         load_config_button.clicked.connect(self.load_custom_config)
         file_layout.addWidget(load_config_button)
         
@@ -2420,6 +2713,12 @@ class LogViewer(QMainWindow):
         self.ansi_processing_action.setChecked(self.ansi_processing_enabled)
         self.ansi_processing_action.triggered.connect(self.toggle_ansi_processing)
         
+        # Large file highlighting toggle
+        self.large_file_highlighting_action = view_menu.addAction("Highlight Large Files")
+        self.large_file_highlighting_action.setCheckable(True)
+        self.large_file_highlighting_action.setChecked(self.large_file_highlighting_enabled)
+        self.large_file_highlighting_action.triggered.connect(self.toggle_large_file_highlighting)
+        
         # Bookmarks menu
         bookmarks_menu = menubar.addMenu("Bookmarks")
         
@@ -2470,13 +2769,23 @@ class LogViewer(QMainWindow):
 
     def show_help(self):
         """Show the help dialog"""
-        help_dialog = HelpDialog(self)
-        help_dialog.exec()
+        self.help_dialog = self.reuse_themed_dialog(self.help_dialog, HelpDialog)
+        self.help_dialog.exec()
 
     def show_about(self):
         """Show the about dialog"""
-        about_dialog = AboutDialog(self)
-        about_dialog.exec()
+        self.about_dialog = self.reuse_themed_dialog(self.about_dialog, AboutDialog)
+        self.about_dialog.exec()
+
+    def reuse_themed_dialog(self, dialog, dialog_class):
+        """Return dialog if it was built for the current theme, otherwise a new dialog_class"""
+        # Static dialogs only depend on the theme, so they are built once and shown
+        # again rather than rebuilding their widgets and stylesheets on every open
+        if dialog is not None and dialog.theme_colors is self.current_theme_colors:
+            return dialog
+        if dialog is not None:
+            dialog.deleteLater()
+        return dialog_class(self)
 
     def create_shortcuts(self):
         """Create keyboard shortcuts"""
@@ -2512,6 +2821,7 @@ class LogViewer(QMainWindow):
     def clear_search(self):
         """Clear the search input and highlights"""
         self.search_input.clear()
+        self.cancel_background_search()
         self.clear_search_highlights()
         # Clear the search highlight range from LogHighlighter
         self.highlighter.clear_search_highlight_range()
@@ -2558,7 +2868,7 @@ class LogViewer(QMainWindow):
         """Update all UI element styles with current theme"""
         colors = self.current_theme_colors
         
-        # Update text editor style
+        # Update text editor style (kept separate since it also carries the font size)
         if hasattr(self, 'text_editor') and self.text_editor:
             self.text_editor.setStyleSheet(f"""
                 QPlainTextEdit {{
@@ -2570,36 +2880,17 @@ class LogViewer(QMainWindow):
                 }}
             """)
         
-        # Update progress bar style
-        if hasattr(self, 'progress_bar') and self.progress_bar:
-            self.progress_bar.setStyleSheet(f"""
-                QProgressBar {{
-                    border: 1px solid {colors.border_color};
-                    border-radius: 3px;
-                    text-align: center;
-                    background-color: {colors.base_bg};
-                    color: {colors.text_color};
-                }}
-                QProgressBar::chunk {{
-                    background-color: {colors.highlight_bg};
-                    width: 10px;
-                }}
-            """)
-        
-        # Update search input style
-        if hasattr(self, 'search_input') and self.search_input:
-            self.search_input.setStyleSheet(f"""
-                QLineEdit {{
-                    background-color: {colors.button_bg};
-                    color: {colors.button_text};
-                    border: 1px solid {colors.border_color};
-                    padding: 5px;
-                    border-radius: 3px;
-                }}
-            """)
+        # Setting the window stylesheet re-polishes every child widget even when the
+        # text is unchanged, and load_config re-applies the theme after every file load
+        if colors is self._applied_window_colors:
+            return
+        self._applied_window_colors = colors
         
-        # Update all buttons with themed style
-        button_style = f"""
+        # Everything else is styled by one stylesheet, parsed once and inherited by
+        # the widgets below. It is set on the central widget and menu bar rather than
+        # the window itself so its unscoped rules do not reach dialogs parented to the
+        # window (message boxes, the color picker, file dialogs).
+        stylesheet = f"""
             QPushButton {{
                 background-color: {colors.button_bg};
                 color: {colors.button_text};
@@ -2613,90 +2904,87 @@ class LogViewer(QMainWindow):
             QPushButton:pressed {{
                 background-color: {colors.pressed_color};
             }}
+            QPushButton#fontSizeButton {{
+                min-width: 30px;
+            }}
+            QLabel {{
+                color: {colors.text_color};
+            }}
+            QLabel#fontSizeDisplay {{
+                padding: 0 10px;
+            }}
+            QLineEdit {{
+                background-color: {colors.button_bg};
+                color: {colors.button_text};
+                border: 1px solid {colors.border_color};
+                padding: 5px;
+                border-radius: 3px;
+            }}
+            QProgressBar {{
+                border: 1px solid {colors.border_color};
+                border-radius: 3px;
+                text-align: center;
+                background-color: {colors.base_bg};
+                color: {colors.text_color};
+            }}
+            QProgressBar::chunk {{
+                background-color: {colors.highlight_bg};
+                width: 10px;
+            }}
+            QMenuBar {{
+                background-color: {colors.menu_bg};
+                color: {colors.menu_text};
+                border: 1px solid {colors.border_color};
+            }}
+            QMenuBar::item {{
+                background-color: {colors.menu_bg};
+                color: {colors.menu_text};
+                padding: 4px 8px;
+            }}
+            QMenuBar::item:selected {{
+                background-color: {colors.menu_hover};
+            }}
+            QMenu {{
+                background-color: {colors.menu_bg};
+                color: {colors.menu_text};
+                border: 1px solid {colors.border_color};
+            }}
+            QMenu::item {{
+                background-color: {colors.menu_bg};
+                color: {colors.menu_text};
+                padding: 4px 20px;
+            }}
+            QMenu::item:selected {{
+                background-color: {colors.menu_hover};
+            }}
+            QCheckBox {{
+                color: {colors.text_color};
+                padding: 5px;
+                spacing: 8px;
+            }}
+            QCheckBox::indicator {{
+                width: 18px;
+                height: 18px;
+                border: 2px solid {colors.border_color};
+                border-radius: 3px;
+                background-color: {colors.button_bg};
+            }}
+            QCheckBox::indicator:hover {{
+                border: 2px solid {colors.text_color};
+                background-color: {colors.hover_color};
+            }}
+            QCheckBox::indicator:checked {{
+                background-color: #4CAF50;
+                border: 2px solid #4CAF50;
+                image: none;
+            }}
+            QCheckBox::indicator:checked:hover {{
+                background-color: #45a049;
+                border: 2px solid #45a049;
+            }}
         """
-        
-        # Apply to all buttons in the main window
-        buttons = self.findChildren(QPushButton)
-        for button in buttons:
-            button.setStyleSheet(button_style)
-        
-        # Update status label style
-        if hasattr(self, 'status_label') and self.status_label:
-            self.status_label.setStyleSheet(f"color: {colors.text_color};")
-        
-        # Update font size display style
-        self.font_size_display.setStyleSheet(f"""
-            color: {colors.text_color};
-            padding: 0 10px;
-        """)
-        
-        # Update menu bar style
-        menubar = self.menuBar()
-        if menubar:
-            menubar.setStyleSheet(f"""
-                QMenuBar {{
-                    background-color: {colors.menu_bg};
-                    color: {colors.menu_text};
-                    border: 1px solid {colors.border_color};
-                }}
-                QMenuBar::item {{
-                    background-color: {colors.menu_bg};
-                    color: {colors.menu_text};
-                    padding: 4px 8px;
-                }}
-                QMenuBar::item:selected {{
-                    background-color: {colors.menu_hover};
-                }}
-                QMenu {{
-                    background-color: {colors.menu_bg};
-                    color: {colors.menu_text};
-                    border: 1px solid {colors.border_color};
-                }}
-                QMenu::item {{
-                    background-color: {colors.menu_bg};
-                    color: {colors.menu_text};
-                    padding: 4px 20px;
-                }}
-                QMenu::item:selected {{
-                    background-color: {colors.menu_hover};
-                }}
-            """)
-        
-        # Update all labels
-        labels = self.findChildren(QLabel)
-        for label in labels:
-            if label != self.font_size_display:  # Skip font size display as it has special styling
-                label.setStyleSheet(f"color: {colors.text_color};")
-        
-        # Update case-sensitive checkbox style
-        if hasattr(self, 'case_sensitive_checkbox') and self.case_sensitive_checkbox:
-            self.case_sensitive_checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    color: {colors.text_color};
-                    padding: 5px;
-                    spacing: 8px;
-                }}
-                QCheckBox::indicator {{
-                    width: 18px;
-                    height: 18px;
-                    border: 2px solid {colors.border_color};
-                    border-radius: 3px;
-                    background-color: {colors.button_bg};
-                }}
-                QCheckBox::indicator:hover {{
-                    border: 2px solid {colors.text_color};
-                    background-color: {colors.hover_color};
-                }}
-                QCheckBox::indicator:checked {{
-                    background-color: #4CAF50;
-                    border: 2px solid #4CAF50;
-                    image: none;
-                }}
-                QCheckBox::indicator:checked:hover {{
-                    background-color: #45a049;
-                    border: 2px solid #45a049;
-                }}
-            """)
+        self.centralWidget().setStyleSheet(stylesheet)
+        self.menuBar().setStyleSheet(stylesheet)
     
     def set_theme_mode(self, theme_mode):
         """Set the theme mode and apply the theme"""
@@ -2711,6 +2999,8 @@ class LogViewer(QMainWindow):
     
     def change_theme(self, theme_mode):
         """Change theme and update UI, called from menu actions"""
+        if theme_mode == ThemeMode.SYSTEM:
+            invalidate_system_theme_cache()
         self.set_theme_mode(theme_mode)
         
         # Update menu selection
@@ -2726,6 +3016,7 @@ class LogViewer(QMainWindow):
         """Manually refresh system theme detection"""
         if self.current_theme_mode == ThemeMode.SYSTEM:
             # Force re-detection by re-applying the theme
+            invalidate_system_theme_cache()
             self.apply_theme()
             self.status_label.setText("System theme refreshed")
         else:
@@ -2736,27 +3027,7 @@ class LogViewer(QMainWindow):
         self.line_wrap_enabled = not self.line_wrap_enabled
         
         # Apply the new line wrap mode to the text editor
-        try:
-            if self.line_wrap_enabled:
-                # Enable word wrapping
-                try:
-                    self.text_editor.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
-                except (AttributeError, TypeError):
-                    try:
-                        self.text_editor.setLineWrapMode(QPlainTextEdit.WidgetWidth)
-                    except (AttributeError, TypeError):
-                        print("Warning: Could not enable line wrap mode.")
-            else:
-                # Disable word wrapping  
-                try:
-                    self.text_editor.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
-                except (AttributeError, TypeError):
-                    try:
-                        self.text_editor.setLineWrapMode(QPlainTextEdit.NoWrap)
-                    except (AttributeError, TypeError):
-                        print("Warning: Could not disable line wrap mode.")
-        except Exception as e:
-            print(f"Error setting line wrap mode: {e}")
+        self.text_editor.setLineWrapMode(_WRAP_WIDGET_WIDTH if self.line_wrap_enabled else _NO_WRAP)
         
         # Update the menu action text if it exists
         if hasattr(self, 'line_wrap_action'):
@@ -2807,6 +3078,38 @@ class LogViewer(QMainWindow):
         ansi_status = "enabled" if self.ansi_processing_enabled else "disabled"
         self.status_label.setText(f"ANSI color processing {ansi_status}")
 
+    def toggle_large_file_highlighting(self):
+        """Toggle highlighting of files over the highlighting size limit"""
+        self.large_file_highlighting_enabled = not self.large_file_highlighting_enabled
+        
+        # Update the menu action state if it exists
+        if hasattr(self, 'large_file_highlighting_action'):
+            self.large_file_highlighting_action.setChecked(self.large_file_highlighting_enabled)
+        
+        # Attach or detach the highlighter for the file already shown
+        if not self.loading_file:
+            self.update_highlighter_attachment()
+        
+        # Save the preference
+        self.save_app_config()
+        
+        # Update status
+        large_status = "enabled" if self.large_file_highlighting_enabled else "disabled"
+        self.status_label.setText(f"Large file highlighting {large_status}")
+
+    def update_highlighter_attachment(self):
+        """Attach the highlighter to the document unless it is too large to highlight"""
+        document = self.text_editor.document()
+        suspend = (not self.large_file_highlighting_enabled and
+                   document.characterCount() > LogHighlighter.MAX_HIGHLIGHT_CHARS)
+        if suspend:
+            self.highlighter.setDocument(None)
+        elif self.highlighting_suspended or self.highlighter.document() is None:
+            # Reattaching the highlighter schedules a single rehighlight of the whole file
+            self.highlighter.setDocument(document)
+        self.highlighting_suspended = suspend
+        return not suspend
+
     def refresh_display(self):
         """Refresh the current file display with current settings"""
         if hasattr(self, 'current_file') and self.current_file and os.path.exists(self.current_file):
@@ -2821,42 +3124,21 @@ class LogViewer(QMainWindow):
             return chunk
         
         lines = chunk.split('\n')
-        numbered_lines = []
+        # Don't add line number to the last empty line if chunk ends with \n
+        trailing = lines.pop() if lines[-1] == '' else None
         
-        for i, line in enumerate(lines):
-            # Don't add line number to the last empty line if chunk ends with \n
-            if i == len(lines) - 1 and line == '':
-                numbered_lines.append(line)
-            else:
-                # Format with 6 digits, right-aligned, followed by: and space
-                numbered_lines.append(f"{self.current_line_number:6d}: {line}")
-                self.current_line_number += 1
+        # Format with 6 digits, right-aligned, followed by: and space
+        start = self.current_line_number
+        numbered_lines = [f"{number:6d}: {line}" for number, line in zip(range(start, start + len(lines)), lines)]
+        self.current_line_number = start + len(lines)
         
+        if trailing is not None:
+            numbered_lines.append(trailing)
         return '\n'.join(numbered_lines)
 
     def apply_line_wrap_setting(self):
         """Apply the current line wrap setting without saving to config"""
-        try:
-            if self.line_wrap_enabled:
-                # Enable word wrapping
-                try:
-                    self.text_editor.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
-                except (AttributeError, TypeError):
-                    try:
-                        self.text_editor.setLineWrapMode(QPlainTextEdit.WidgetWidth)
-                    except (AttributeError, TypeError):
-                        print("Warning: Could not enable line wrap mode.")
-            else:
-                # Disable word wrapping  
-                try:
-                    self.text_editor.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
-                except (AttributeError, TypeError):
-                    try:
-                        self.text_editor.setLineWrapMode(QPlainTextEdit.NoWrap)
-                    except (AttributeError, TypeError):
-                        print("Warning: Could not disable line wrap mode.")
-        except Exception as e:
-            print(f"Error setting line wrap mode: {e}")
+        self.text_editor.setLineWrapMode(_WRAP_WIDGET_WIDTH if self.line_wrap_enabled else _NO_WRAP)
         
         # Update the menu action state if it exists
         if hasattr(self, 'line_wrap_action'):
@@ -2865,12 +3147,15 @@ class LogViewer(QMainWindow):
     def save_app_config(self):
         """Save application configuration including theme preference"""
         try:
+            yaml, SafeLoader, SafeDumper = load_yaml_module()
+            
             # Load existing config or create new one
             config = {}
             if os.path.exists(self.config_path):
                 try:
-                    with open(self.config_path, 'r', encoding='utf-8') as f:
-                        config = yaml.safe_load(f) or {}
+                    # Hand libyaml the raw bytes rather than going through a text wrapper
+                    with open(self.config_path, 'rb') as f:
+                        config = yaml.load(f.read(), Loader=SafeLoader) or {}
                 except Exception:
                     config = {}
             
@@ -2892,6 +3177,9 @@ class LogViewer(QMainWindow):
             # Update ANSI processing preference
             config['ansi_processing_enabled'] = self.ansi_processing_enabled
             
+            # Update large file highlighting preference
+            config['large_file_highlighting_enabled'] = self.large_file_highlighting_enabled
+            
             # Save bookmarks (only for current file if available)
             if hasattr(self, 'current_file') and self.current_file and self.bookmarks:
                 if 'bookmarks' not in config:
@@ -2912,8 +3200,13 @@ class LogViewer(QMainWindow):
             if config_dir:  # Only create directory if path has a directory component
                 os.makedirs(config_dir, exist_ok=True)
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, default_flow_style=False)
+            config_data = yaml.dump(config, Dumper=SafeDumper, default_flow_style=False, encoding='utf-8')
+            with open(self.config_path, 'wb') as f:
+                f.write(config_data)
+            
+            # Refresh the JSON sidecar so the next startup can skip YAML parsing
+            invalidate_config_cache(self.config_path)
+            self._write_config_cache(config)
                 
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -2925,8 +3218,11 @@ class LogViewer(QMainWindow):
         if not search_term:
             return
             
-        # Start the debounced search
-        self.search_timer.start(100)  # 100ms debounce
+        # Start the debounced search; repeated Enter/Find presses within the window
+        # collapse into one search, and the window grows with the document
+        # (100ms, plus 10ms per MB of text, at most 400ms)
+        document_size = self.text_editor.document().characterCount()
+        self.search_timer.start(min(400, 100 + (document_size >> 20) * 10))
     
     def perform_search(self):
         """Perform the actual search after debounce delay"""
@@ -2947,23 +3243,12 @@ class LogViewer(QMainWindow):
         
         # Move to beginning of document
         cursor = self.text_editor.textCursor()
-        
-        # Use try/except to handle different PyQt versions
-        try:
-            cursor.movePosition(QtConstants.MoveStart)  # Use our constant
-        except (AttributeError, TypeError):
-            try:
-                cursor.movePosition(QTextCursor.Start)
-            except (AttributeError, TypeError):
-                try:
-                    cursor.movePosition(QTextCursor.MoveOperation.Start)
-                except (AttributeError, TypeError):
-                    print("Warning: Could not move cursor to start.")
-                    
+        cursor.movePosition(_MOVE_START)
         self.text_editor.setTextCursor(cursor)
         
-        # Find the first occurrence
-        self.find_next()
+        # Find the first occurrence, once the background scan is done for large documents
+        if not self.start_background_search(search_term):
+            self.find_next()
 
     def find_next(self):
         """Find the next occurrence of the search term"""
@@ -2975,19 +3260,7 @@ class LogViewer(QMainWindow):
             # First search or new search term
             self.search_results = []
             start_cursor = self.text_editor.textCursor()
-            
-            # Use try/except to handle different PyQt versions
-            try:
-                start_cursor.movePosition(QtConstants.MoveStart)  # Use our constant
-            except (AttributeError, TypeError):
-                try:
-                    start_cursor.movePosition(QTextCursor.Start)
-                except (AttributeError, TypeError):
-                    try:
-                        start_cursor.movePosition(QTextCursor.MoveOperation.Start)
-                    except (AttributeError, TypeError):
-                        print("Warning: Could not move cursor to start.")
-                        
+            start_cursor.movePosition(_MOVE_START)
             self.text_editor.setTextCursor(start_cursor)
             self.find_all_occurrences(search_term)
             
@@ -2995,10 +3268,14 @@ class LogViewer(QMainWindow):
                 self.status_label.setText(f"No matches found for '{search_term}'")
                 return
                 
-        # Move to the next result
+        # Move to the next result, wrapping past the last one back to the first
         if self.search_results:
-            self.current_search_index = (self.current_search_index + 1) % len(self.search_results)
+            index = self.current_search_index + 1
+            wrapped = index >= len(self.search_results)
+            self.current_search_index = 0 if wrapped else index
             self.highlight_current_match()
+            if wrapped:
+                self.status_label.setText(f"{self.status_label.text()} (wrapped to top)")
     
     def find_previous(self):
         """Find the previous occurrence of the search term"""
@@ -3010,19 +3287,7 @@ class LogViewer(QMainWindow):
             # First search or new search term - start from end
             self.search_results = []
             start_cursor = self.text_editor.textCursor()
-            
-            # Use try/except to handle different PyQt versions
-            try:
-                start_cursor.movePosition(QtConstants.MoveStart)  # Use our constant
-            except (AttributeError, TypeError):
-                try:
-                    start_cursor.movePosition(QTextCursor.Start)
-                except (AttributeError, TypeError):
-                    try:
-                        start_cursor.movePosition(QTextCursor.MoveOperation.Start)
-                    except (AttributeError, TypeError):
-                        print("Warning: Could not move cursor to start.")
-                        
+            start_cursor.movePosition(_MOVE_START)
             self.text_editor.setTextCursor(start_cursor)
             self.find_all_occurrences(search_term)
             
@@ -3033,10 +3298,14 @@ class LogViewer(QMainWindow):
             # Start from the last match
             self.current_search_index = len(self.search_results)
                 
-        # Move to the previous result
+        # Move to the previous result, wrapping past the first one back to the last
         if self.search_results:
-            self.current_search_index = (self.current_search_index - 1) % len(self.search_results)
+            index = self.current_search_index - 1
+            wrapped = index < 0
+            self.current_search_index = len(self.search_results) - 1 if wrapped else index
             self.highlight_current_match()
+            if wrapped:
+                self.status_label.setText(f"{self.status_label.text()} (wrapped to bottom)")
     
     def highlight_current_match(self):
         """Highlight the current match line"""
@@ -3049,36 +3318,12 @@ class LogViewer(QMainWindow):
         search_term = self.search_input.text()
         position = self.search_results[self.current_search_index]
         
-        # Navigate to the position and highlight the entire line
+        # Navigate to the position and highlight the entire line. findBlock looks the
+        # line up in the document's block tree, so no cursor walk is needed.
+        block = self.text_editor.document().findBlock(position)
         cursor = self.text_editor.textCursor()
-        cursor.setPosition(position)
-        
-        # Select the entire line
-        try:
-            cursor.movePosition(QTextCursor.MoveOperation.StartOfLine)
-        except (AttributeError, TypeError):
-            try:
-                cursor.movePosition(QTextCursor.StartOfLine)
-            except (AttributeError, TypeError):
-                try:
-                    cursor.movePosition(QtConstants.StartOfLine)
-                except (AttributeError, TypeError):
-                    print("Warning: Could not move to start of line.")
-        
-        # Select to end of line with compatibility handling
-        try:
-            cursor.movePosition(QTextCursor.MoveOperation.EndOfLine, QTextCursor.MoveMode.KeepAnchor)
-        except (AttributeError, TypeError):
-            try:
-                cursor.movePosition(QTextCursor.EndOfLine, QTextCursor.KeepAnchor)
-            except (AttributeError, TypeError):
-                try:
-                    cursor.movePosition(QTextCursor.MoveOperation.EndOfLine, QtConstants.KeepAnchor)
-                except (AttributeError, TypeError):
-                    try:
-                        cursor.movePosition(QtConstants.EndOfLine, QtConstants.KeepAnchor)
-                    except (AttributeError, TypeError):
-                        print("Warning: Could not select to end of line.")
+        cursor.setPosition(block.position())
+        cursor.setPosition(block.position() + block.length() - 1, _KEEP_ANCHOR)
         
         # Store the line positions for clearing later
         self.current_highlight_start = cursor.selectionStart()
@@ -3087,8 +3332,16 @@ class LogViewer(QMainWindow):
         # Inform the LogHighlighter about the search-highlighted range
         self.highlighter.set_search_highlight_range(self.current_highlight_start, self.current_highlight_end)
         
+        # Remember the line's own formats (ANSI colors) so clearing can put them back
+        self.current_highlight_formats = []
+        fragments = block.begin()
+        while not fragments.atEnd():
+            fragment = fragments.fragment()
+            self.current_highlight_formats.append((fragment.position(), fragment.length(), fragment.charFormat()))
+            fragments += 1
+        
         # Apply yellow highlighting to the entire line
-        cursor.setCharFormat(self.search_highlight_format)
+        cursor.mergeCharFormat(self.search_highlight_format)
         
         # Position cursor at the search term for visibility (but don't change selection)
         cursor.setPosition(position)
@@ -3100,30 +3353,168 @@ class LogViewer(QMainWindow):
     
     def find_all_occurrences(self, search_term):
         """Find all occurrences of the search term in the document"""
-        # Get the full text (more efficient than searching through the document)
-        full_text = self.text_editor.toPlainText()
-        
-        # Prepare search term and text based on case sensitivity
-        if self.case_sensitive_search:
-            search_text = full_text
-            term_to_find = search_term
+        # Prepare search term based on case sensitivity
+        term_to_find = search_term if self.case_sensitive_search else search_term.lower()
+        
+        # Repeating a recent search on an unchanged document needs no scan
+        cache_key = (self.case_sensitive_search, term_to_find)
+        matches = self.search_results_cache.get(cache_key)
+        if matches is not None:
+            self.search_results_cache.move_to_end(cache_key)
         else:
-            search_text = full_text.lower()
-            term_to_find = search_term.lower()
-        
-        # Find all occurrences
-        start = 0
-        while True:
-            pos = search_text.find(term_to_find, start)
-            if pos == -1:
-                break
-            self.search_results.append(pos)
-            start = pos + len(term_to_find)
+            search_text = self.get_search_text(self.case_sensitive_search)
+            
+            # Find all non-overlapping occurrences in one scan; the escaped term is a
+            # plain literal, so the regex engine does the looping instead of Python.
+            # Its literal search runs in C and already skips ahead on mismatches, so
+            # misses cost about the same as str.find (around 30ms per 80MB of text).
+            term_pattern = re.compile(re.escape(term_to_find))
+            matches = [match.start() for match in term_pattern.finditer(search_text)]
+            self.cache_search_results(cache_key, matches)
+        
+        self.search_results.extend(matches)
         
         # Update the UI to reflect the number of matches
         if self.search_results:
             self.status_label.setText(f"Found {len(self.search_results)} matches")
     
+    def get_search_text(self, case_sensitive):
+        """Return the document text to search, extracting and lowering it once per document change"""
+        # Get the full text (more efficient than searching through the document:
+        # a QTextDocument.find loop costs a Python round trip and a QTextCursor per
+        # match, about 8x slower than one copy plus a regex scan on 100k lines)
+        if self.plain_text_cache is None:
+            self.plain_text_cache = self.text_editor.toPlainText()
+        if case_sensitive:
+            return self.plain_text_cache
+        if self.lowered_text_cache is None:
+            self.lowered_text_cache = self.plain_text_cache.lower()
+        return self.lowered_text_cache
+    
+    def cache_search_results(self, cache_key, matches):
+        """Remember the match positions for the most recent 32 searches"""
+        self.search_results_cache[cache_key] = matches
+        self.search_results_cache.move_to_end(cache_key)
+        if len(self.search_results_cache) > 32:
+            self.search_results_cache.popitem(last=False)
+    
+    def start_background_search(self, search_term):
+        """Scan a large document in the thread pool; returns False if the search should run inline"""
+        term_to_find = search_term if self.case_sensitive_search else search_term.lower()
+        cache_key = (self.case_sensitive_search, term_to_find)
+        # Cached results and small documents are quicker to handle directly
+        if cache_key in self.search_results_cache or self.text_editor.document().characterCount() < (1 << 20):
+            return False
+        
+        self.cancel_background_search()
+        
+        # The text must be read on the UI thread; lowering and scanning it happen in the worker
+        if self.plain_text_cache is None:
+            self.plain_text_cache = self.text_editor.toPlainText()
+        if self.case_sensitive_search:
+            worker = SearchWorker(self.plain_text_cache, term_to_find)
+        elif self.lowered_text_cache is not None:
+            worker = SearchWorker(self.lowered_text_cache, term_to_find)
+        else:
+            worker = SearchWorker(self.plain_text_cache, term_to_find, lower_text=True)
+        
+        signals = worker.signals
+        text_version = self.search_text_version
+        signals.result.connect(lambda result: self.on_search_finished(signals, search_term, cache_key,
+                                                                      text_version, result))
+        signals.error.connect(lambda error_msg: self.on_search_error(signals, error_msg))
+        self.search_signals = signals
+        self.status_label.setText(f"Searching for '{search_term}'...")
+        self.threadpool.start(worker)
+        return True
+    
+    def cancel_background_search(self):
+        """Abandon the background search in progress, if any"""
+        if self.search_signals is not None:
+            self.search_signals.cancelled.set()
+            self.search_signals = None
+    
+    def on_search_finished(self, signals, search_term, cache_key, text_version, result):
+        """Store the results of a background search and move to the first match"""
+        if signals is not self.search_signals:
+            return  # Superseded by a newer search
+        self.search_signals = None
+        
+        # Results for text that has changed since are dropped; find_next rescans then
+        search_text, matches = result
+        if text_version == self.search_text_version:
+            if not cache_key[0]:
+                self.lowered_text_cache = search_text
+            self.cache_search_results(cache_key, matches)
+        
+        # Navigate only if the user hasn't started another search meanwhile
+        if self.search_input.text() == search_term and self.current_search_index == -1:
+            self.find_next()
+    
+    def on_search_error(self, signals, error_msg):
+        """Fall back to searching on the UI thread if the background search fails"""
+        if signals is not self.search_signals:
+            return
+        self.search_signals = None
+        print(f"Background search failed: {error_msg}")
+        if self.current_search_index == -1:
+            self.find_next()
+    
+    def invalidate_search_text(self, position, chars_removed, chars_added):
+        """Drop the cached search text and results once the document text changes"""
+        # Search highlighting only changes formats, reported as equal removed/added counts
+        if chars_removed == chars_added:
+            return
+        self.search_text_version += 1
+        
+        # Text appended while a file is still loading only needs the new part scanned
+        if (self.plain_text_cache is not None and chars_removed == 0 and
+                position == len(self.plain_text_cache) and
+                self.extend_search_cache(position, chars_added)):
+            return
+        
+        self.plain_text_cache = None
+        self.lowered_text_cache = None
+        self.search_results_cache.clear()
+    
+    def extend_search_cache(self, position, chars_added):
+        """Add appended text to the cached search text and results; False if it cannot be done"""
+        cursor = QTextCursor(self.text_editor.document())
+        cursor.setPosition(position)
+        cursor.setPosition(position + chars_added, _KEEP_ANCHOR)
+        # Convert to the same form toPlainText() returns
+        added_text = cursor.selectedText().replace('\u2029', '\n').replace('\xa0', ' ')
+        if len(added_text) != chars_added:
+            return False
+        
+        old_lengths = {True: len(self.plain_text_cache)}
+        self.plain_text_cache += added_text
+        if self.lowered_text_cache is not None:
+            old_lengths[False] = len(self.lowered_text_cache)
+            self.lowered_text_cache += added_text.lower()
+        
+        active_key = (self.case_sensitive_search, self.search_input.text() if self.case_sensitive_search
+                      else self.search_input.text().lower())
+        for cache_key in list(self.search_results_cache):
+            case_sensitive, term = cache_key
+            if case_sensitive not in old_lengths:
+                # The lowered text these results came from is no longer kept
+                del self.search_results_cache[cache_key]
+                continue
+            search_text = self.get_search_text(case_sensitive)
+            matches = self.search_results_cache[cache_key]
+            # Resume after the last match, or early enough to catch one spanning the join
+            start = max(matches[-1] + len(term) if matches else 0, old_lengths[case_sensitive] - len(term) + 1)
+            term_pattern = re.compile(re.escape(term))
+            new_matches = [match.start() for match in term_pattern.finditer(search_text, start)]
+            matches.extend(new_matches)
+            
+            # Keep an active search up to date as well
+            if new_matches and cache_key == active_key and self.current_search_index != -1:
+                self.search_results.extend(new_matches)
+                self.status_label.setText(f"Found {len(self.search_results)} matches")
+        return True
+    
     def clear_search_highlights(self):
         """Clear all search highlights"""
 
@@ -3141,30 +3532,19 @@ class LogViewer(QMainWindow):
             # Clear the search highlight range from LogHighlighter first
             self.highlighter.clear_search_highlight_range()
             
-            # Create a new cursor to clear the formatting
+            # Put back the formats the line had before the search highlight. The
+            # format change makes the highlighter redo this line on its own, which
+            # restores the config-based highlights without a rehighlight() call.
             cursor = self.text_editor.textCursor()
-            cursor.setPosition(self.current_highlight_start)
-            
-            # Select the same range
-            try:
-                cursor.setPosition(self.current_highlight_end, QTextCursor.MoveMode.KeepAnchor)
-            except (AttributeError, TypeError):
-                try:
-                    cursor.setPosition(self.current_highlight_end, QTextCursor.KeepAnchor)
-                except (AttributeError, TypeError):
-                    cursor.setPosition(self.current_highlight_end, QtConstants.KeepAnchor)
-            
-            # Clear the formatting by removing all character formatting
-            default_format = QTextCharFormat()
-            # Don't set any colors - let the theme handle it
-            cursor.setCharFormat(default_format)
+            for position, length, char_format in self.current_highlight_formats:
+                cursor.setPosition(position)
+                cursor.setPosition(position + length, _KEEP_ANCHOR)
+                cursor.setCharFormat(char_format)
             
             # Clear the stored positions
             self.current_highlight_start = None
             self.current_highlight_end = None
-            
-            # Trigger rehighlighting to restore config-based highlights
-            self.highlighter.rehighlight()
+            self.current_highlight_formats = []
 
     # Bookmark functionality
     def toggle_bookmark(self):
@@ -3175,12 +3555,13 @@ class LogViewer(QMainWindow):
     
     def toggle_bookmark_at_line(self, line_number):
         """Toggle bookmark at specific line number"""
-        # Check if bookmark already exists at this line
+        # Check if bookmark already exists at this line, only scanning the list when it does
         existing_bookmark = None
-        for bookmark in self.bookmarks:
-            if bookmark['line'] == line_number:
-                existing_bookmark = bookmark
-                break
+        if line_number in self.bookmark_lines:
+            for bookmark in self.bookmarks:
+                if bookmark['line'] == line_number:
+                    existing_bookmark = bookmark
+                    break
         
         if existing_bookmark:
             # Remove existing bookmark
@@ -3299,7 +3680,7 @@ class LogViewer(QMainWindow):
     def configure_bookmark_color(self):
         """Open color picker dialog to configure bookmark highlight color"""
         current_color = QColor(self.bookmark_highlight_color)
-        color = QColorDialog.getColor(current_color, self, "Choose Bookmark Highlight Color")
+        color = pick_color(current_color, self, "Choose Bookmark Highlight Color")
         
         if color.isValid():
             # Update bookmark color
@@ -3318,13 +3699,10 @@ class LogViewer(QMainWindow):
     
     def update_bookmark_highlight_format(self):
         """Update the bookmark highlight format based on configured color"""
-        color = QColor(self.bookmark_highlight_color)
+        color, text_color = get_color(self.bookmark_highlight_color)
         self.bookmark_highlight_format.setBackground(color)
-        # Auto-select text color based on background brightness
-        if color.lightness() > 128:
-            self.bookmark_highlight_format.setForeground(QColor(0, 0, 0))  # Dark text
-        else:
-            self.bookmark_highlight_format.setForeground(QColor(255, 255, 255))  # Light text
+        # Auto-selected text color based on background brightness
+        self.bookmark_highlight_format.setForeground(text_color)
         
         # Update highlighter if it exists
         if hasattr(self, 'highlighter'):
@@ -3332,10 +3710,10 @@ class LogViewer(QMainWindow):
     
     def update_bookmark_highlights(self):
         """Update visual highlighting for bookmarked lines"""
+        # Extract line numbers from bookmarks, kept for quick membership checks
+        self.bookmark_lines = {bookmark['line'] for bookmark in self.bookmarks}
         if hasattr(self, 'highlighter'):
-            # Extract line numbers from bookmarks
-            bookmarked_lines = [bookmark['line'] for bookmark in self.bookmarks]
-            self.highlighter.set_bookmarked_lines(bookmarked_lines)
+            self.highlighter.set_bookmarked_lines(self.bookmark_lines)
     
     def load_bookmarks_for_current_file(self):
         """Load bookmarks for the currently open file"""
@@ -3344,77 +3722,130 @@ class LogViewer(QMainWindow):
         
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f) or {}
-                    if 'bookmarks' in config and self.current_file in config['bookmarks']:
-                        self.bookmarks = config['bookmarks'][self.current_file]
-                        self.update_bookmark_highlights()
-                        if self.bookmarks:
-                            self.status_label.setText(f"Loaded {len(self.bookmarks)} bookmarks for this file")
+                # Shares the in-memory/JSON cache and libyaml loader with load_config
+                config = self._load_cached_config() or {}
+                if 'bookmarks' in config and self.current_file in config['bookmarks']:
+                    self.bookmarks = config['bookmarks'][self.current_file]
+                    self.update_bookmark_highlights()
+                    if self.bookmarks:
+                        self.status_label.setText(f"Loaded {len(self.bookmarks)} bookmarks for this file")
         except Exception as e:
             print(f"Error loading bookmarks: {e}")
 
+    def _load_cached_config(self):
+        """Load the config from memory or its JSON sidecar if up to date, otherwise parse the YAML"""
+        config_stat = os.stat(self.config_path)
+        version = (config_stat.st_mtime_ns, config_stat.st_size)
+        cached = _CONFIG_CACHE.get(os.path.abspath(self.config_path))
+        if cached is not None and cached[0] == version:
+            # Decode a fresh copy, callers keep and modify parts of the config
+            return json.loads(cached[1])
+        
+        json_path = self.config_path + ".json"
+        try:
+            if os.path.getmtime(json_path) >= config_stat.st_mtime:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    cache_data = f.read()
+                config = json.loads(cache_data)
+                cache_config(self.config_path, version, cache_data)
+                return config
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache, fall back to YAML
+        
+        yaml, SafeLoader, _ = load_yaml_module()
+        with open(self.config_path, 'rb') as f:
+            config = yaml.load(f.read(), Loader=SafeLoader)
+        cache_data = self._write_config_cache(config)
+        if cache_data is not None:
+            cache_config(self.config_path, version, cache_data)
+        return config
+    
+    def _write_config_cache(self, config):
+        """Write the parsed config next to the YAML file as JSON and return the JSON text"""
+        try:
+            cache_data = json.dumps(config)
+        except (TypeError, ValueError):
+            return None  # Not representable as JSON, YAML remains the source of truth
+        try:
+            with open(self.config_path + ".json", 'w', encoding='utf-8') as f:
+                f.write(cache_data)
+        except OSError:
+            pass  # The cache file is optional
+        return cache_data
+
     def load_config(self):
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
-                    if 'highlight_terms' in config:
-                        self.highlight_terms = config['highlight_terms']
-                        self.highlighter.set_highlight_terms(self.highlight_terms)
-                    
-                    # Load theme preference if present
-                    if 'theme' in config:
-                        try:
-                            self.current_theme_mode = ThemeMode(config['theme'])
-                        except (ValueError, KeyError):
-                            self.current_theme_mode = ThemeMode.SYSTEM
-                    
-                    # Load line wrap preference if present
-                    if 'line_wrap_enabled' in config:
-                        self.line_wrap_enabled = config['line_wrap_enabled']
-                        # Apply the loaded line wrap setting
-                        self.apply_line_wrap_setting()
-                    
-                    # Load line numbers preference if present
-                    if 'line_numbers_enabled' in config:
-                        self.line_numbers_enabled = config['line_numbers_enabled']
-                    
-                    # Load bookmark highlight color if present
-                    if 'bookmark_highlight_color' in config:
-                        self.bookmark_highlight_color = config['bookmark_highlight_color']
-                        self.update_bookmark_highlight_format()
-                    
-                    # Load case-sensitive search preference if present
-                    if 'case_sensitive_search' in config:
-                        self.case_sensitive_search = config['case_sensitive_search']
-                        # Update checkbox if it exists
-                        if hasattr(self, 'case_sensitive_checkbox'):
-                            self.case_sensitive_checkbox.setChecked(self.case_sensitive_search)
-                    
-                    # Load ANSI processing preference if present
-                    if 'ansi_processing_enabled' in config:
-                        self.ansi_processing_enabled = config['ansi_processing_enabled']
-                        # Update menu action if it exists
-                        if hasattr(self, 'ansi_processing_action'):
-                            self.ansi_processing_action.setChecked(self.ansi_processing_enabled)
-                    
-                    # Load bookmarks for current file if present
-                    if hasattr(self, 'current_file') and self.current_file and 'bookmarks' in config:
-                        file_bookmarks = config['bookmarks'].get(self.current_file, [])
-                        if file_bookmarks:
-                            self.bookmarks = file_bookmarks
-                            self.update_bookmark_highlights()
-                    
-                    # Display which config file was loaded
-                    user_config_path = os.path.join(os.path.expanduser('~'), 'logviewer_config.yml')
-                    if self.config_path == user_config_path:
-                        self.status_label.setText("User default config loaded from ~/logviewer_config.yml")
-                    else:
-                        self.status_label.setText(f"Config loaded from {self.config_path}")
+                config = self._load_cached_config()
+                if 'highlight_terms' in config:
+                    self.highlight_terms = config['highlight_terms']
+                    self.highlighter.set_highlight_terms(self.highlight_terms)
+                
+                # Load theme preference if present
+                if 'theme' in config:
+                    try:
+                        self.current_theme_mode = ThemeMode(config['theme'])
+                    except (ValueError, KeyError):
+                        self.current_theme_mode = ThemeMode.SYSTEM
+                
+                # Load line wrap preference if present
+                if 'line_wrap_enabled' in config:
+                    self.line_wrap_enabled = config['line_wrap_enabled']
+                    # Apply the loaded line wrap setting
+                    self.apply_line_wrap_setting()
+                
+                # Load line numbers preference if present
+                if 'line_numbers_enabled' in config:
+                    self.line_numbers_enabled = config['line_numbers_enabled']
+                
+                # Load bookmark highlight color if present
+                if 'bookmark_highlight_color' in config:
+                    self.bookmark_highlight_color = config['bookmark_highlight_color']
+                    self.update_bookmark_highlight_format()
+                
+                # Load case-sensitive search preference if present
+                if 'case_sensitive_search' in config:
+                    self.case_sensitive_search = config['case_sensitive_search']
+                    # Update checkbox if it exists
+                    if hasattr(self, 'case_sensitive_checkbox'):
+                        self.case_sensitive_checkbox.setChecked(self.case_sensitive_search)
+                
+                # Load ANSI processing preference if present
+                if 'ansi_processing_enabled' in config:
+                    self.ansi_processing_enabled = config['ansi_processing_enabled']
+                    # Update menu action if it exists
+                    if hasattr(self, 'ansi_processing_action'):
+                        self.ansi_processing_action.setChecked(self.ansi_processing_enabled)
+                
+                # Load large file highlighting preference if present
+                if 'large_file_highlighting_enabled' in config:
+                    self.large_file_highlighting_enabled = config['large_file_highlighting_enabled']
+                    # Update menu action if it exists
+                    if hasattr(self, 'large_file_highlighting_action'):
+                        self.large_file_highlighting_action.setChecked(self.large_file_highlighting_enabled)
+                    if not self.loading_file:
+                        self.update_highlighter_attachment()
+                
+                # Load bookmarks for current file if present
+                if hasattr(self, 'current_file') and self.current_file and 'bookmarks' in config:
+                    file_bookmarks = config['bookmarks'].get(self.current_file, [])
+                    if file_bookmarks:
+                        self.bookmarks = file_bookmarks
+                        self.update_bookmark_highlights()
+                
+                # Display which config file was loaded
+                user_config_path = os.path.join(os.path.expanduser('~'), 'logviewer_config.yml')
+                if self.config_path == user_config_path:
+                    self.status_label.setText("User default config loaded from ~/logviewer_config.yml")
+                else:
+                    self.status_label.setText(f"Config loaded from {self.config_path}")
             else:
                 # No configuration file found, use defaults
                 self.status_label.setText("No configuration file found, using defaults")
+            
+            # This runs right after every file load, so say here why the file is uncolored
+            if self.highlighting_suspended:
+                self.status_label.setText(self.status_label.text() + " - highlighting disabled for large file (View > Highlight Large Files)")
                         
             # Ensure we always have a valid theme mode
             if not hasattr(self, 'current_theme_mode') or self.current_theme_mode is None:
@@ -3466,16 +3897,7 @@ class LogViewer(QMainWindow):
     def configure_highlighting(self):
         dialog = ConfigDialog(self, self.highlight_terms)
         
-        # Use try/except to handle different PyQt versions for dialog execution
-        try:
-            result = dialog.exec()
-        except AttributeError:
-            # For PyQt6 < 6.0
-            try:
-                result = dialog.exec_()
-            except AttributeError:
-                result = QtConstants.Rejected
-                print("Warning: Could not execute dialog.")
+        result = _dialog_exec(dialog)
         
         # Compare with our constant for consistency
         if result == QtConstants.Accepted:
@@ -3529,7 +3951,18 @@ class LogViewer(QMainWindow):
             
         self.loading_file = True
         self.current_file = file_path
-        self.total_content = ""
+        
+        # Detach the highlighter while streaming so blocks aren't highlighted chunk by chunk
+        self.highlighter.setDocument(None)
+        
+        # Drop the search state of the previous text, so find_next does not write the
+        # saved match formats back at their old offsets in the new document
+        self.highlighter.clear_search_highlight_range()
+        self.current_highlight_start = None
+        self.current_highlight_end = None
+        self.current_highlight_formats = []
+        self.search_results = []
+        self.current_search_index = -1
         
         # Clear previous content
         self.text_editor.clear()
@@ -3537,33 +3970,56 @@ class LogViewer(QMainWindow):
         
         # Clear previous bookmarks and reset line counter
         self.bookmarks.clear()
+        self.update_bookmark_highlights()
         self.current_line_number = 1
+        self.skipped_lines = 0
         
         # Show progress bar
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(True)
         
-        # Create worker with smaller chunk size
-        worker = FileLoaderWorker(file_path)
+        # Create worker, reading only as many trailing lines as the editor keeps
+        # The tail also holds the block after the final newline (empty when the file
+        # ends with one), so one line fewer than the block limit fills the editor
+        # exactly; one more block would make it evict the first loaded line
+        worker = FileLoaderWorker(file_path, max_lines=OptimizedTextEdit.MAX_BLOCKS - 1)
         
         # Connect signals
-        worker.signals.chunk_ready.connect(self.on_chunk_ready)
         worker.signals.error.connect(self.on_file_error)
         worker.signals.progress.connect(self.update_progress)
         worker.signals.finished.connect(self.on_loading_finished)
         
+        # Start draining queued chunks into the editor
+        self.loader_signals = worker.signals
+        self.chunk_drain_timer.start()
+        
         # Execute worker
         self.threadpool.start(worker)
     
+    def drain_pending_chunks(self, max_chunks=1):
+        """Display chunks queued by the file loader, letting it read further ahead"""
+        signals = self.loader_signals
+        if signals is None:
+            return
+        
+        pending = signals.pending_chunks
+        drained = 0
+        while pending and (max_chunks is None or drained < max_chunks):
+            chunk, chunk_number, total_chunks = pending.popleft()
+            signals.chunk_slots.release()
+            if signals.skipped_lines:
+                # Keep line numbers true to the file when its head was skipped
+                self.current_line_number += signals.skipped_lines
+                self.skipped_lines, signals.skipped_lines = signals.skipped_lines, 0
+            self.on_chunk_ready(chunk, chunk_number, total_chunks)
+            drained += 1
+    
     def update_progress(self, value):
         """Update progress bar"""
         self.progress_bar.setValue(value)
     
     def on_chunk_ready(self, chunk, chunk_number, total_chunks):
         """Handle a chunk of text from the file loader"""
-        # Append to the total content (always store original content)
-        self.total_content += chunk
-        
         # Process chunk with line numbers if enabled
         display_chunk = self.add_line_numbers_to_chunk(chunk)
         
@@ -3575,9 +4031,23 @@ class LogViewer(QMainWindow):
     
     def on_loading_finished(self):
         """Handle completion of file loading"""
+        # Display whatever the worker queued before it finished
+        self.chunk_drain_timer.stop()
+        self.drain_pending_chunks(max_chunks=None)
+        self.loader_signals = None
+        self.text_editor.flush_pending_text()
+        
+        self.update_highlighter_attachment()
+        
         self.loading_file = False
         self.progress_bar.setVisible(False)
-        self.status_label.setText(f"File loaded: {self.current_file}")
+        if self.skipped_lines:
+            # The empty block after a final newline is not a line of the file
+            document = self.text_editor.document()
+            shown_lines = document.blockCount() - (not document.lastBlock().text())
+            self.status_label.setText(f"File loaded: {self.current_file} (showing the last {shown_lines} lines)")
+        else:
+            self.status_label.setText(f"File loaded: {self.current_file}")
         
         # Apply highlighting after file is completely loaded
         safe_single_shot(100, self.load_config)
@@ -3587,23 +4057,22 @@ class LogViewer(QMainWindow):
         
         # Move cursor to start for better performance
         cursor = self.text_editor.textCursor()
-        
-        # Use try/except to handle different PyQt versions
-        try:
-            cursor.movePosition(QtConstants.MoveStart)  # Use our constant
-        except (AttributeError, TypeError):
-            try:
-                cursor.movePosition(QTextCursor.Start)
-            except (AttributeError, TypeError):
-                try:
-                    cursor.movePosition(QTextCursor.MoveOperation.Start)
-                except (AttributeError, TypeError):
-                    print("Warning: Could not move cursor to start.")
-                    
+        cursor.movePosition(_MOVE_START)
         self.text_editor.setTextCursor(cursor)
     
+    def closeEvent(self, event):
+        """Stop any file load or search still running in the background"""
+        if self.loader_signals is not None:
+            self.loader_signals.cancelled.set()
+        self.cancel_background_search()
+        super().closeEvent(event)
+    
     def on_file_error(self, error_msg):
         """Handle file loading errors"""
+        self.chunk_drain_timer.stop()
+        self.loader_signals = None
+        self.highlighter.setDocument(self.text_editor.document())
+        self.highlighting_suspended = False
         self.loading_file = False
         self.progress_bar.setVisible(False)
         self.status_label.setText(f"Error opening file: {error_msg}")
@@ -3624,7 +4093,7 @@ def main():
     app.setApplicationVersion(APP_VERSION)
     
     # Platform-specific application settings
-    if platform.system() == 'Windows':
+    if PLATFORM_SYSTEM == 'Windows':
         # Enable high DPI support for Windows (with error handling for different PyQt6 versions)
         try:
             # Try PyQt6 style first
@@ -3638,7 +4107,7 @@ def main():
             except AttributeError:
                 # If high DPI attributes don't exist, continue without them
                 print("Note: High DPI scaling attributes not available in this PyQt6 version")
-    elif platform.system() == 'Darwin':  # macOS
+    elif PLATFORM_SYSTEM == 'Darwin':  # macOS
         # Enable high DPI support for macOS
         try:
             app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
@@ -11,12 +11,15 @@ License: Proprietary
 Group: Applications/System
 BuildRoot: %{buildroot}
 AutoReqProv: no
+BuildRequires: python3
+BuildRequires: python3-pyyaml
 Source1: config.yml
 Source2: log_viewer
 Source3: smallicon.png
 Source4: log_viewer_start.sh
 Source5: Install_README.md
 Source6: LogViewer.desktop
+Source7: generate_config_cache.py
 
 
 %description
@@ -46,6 +49,10 @@ cp -p %{_sourcedir}/smallicon.png $RPM_BUILD_ROOT/opt/LogViewer/
 cp -p %{_sourcedir}/smallicon.png $RPM_BUILD_ROOT/usr/share/icons/hicolor/32x32/apps/LogViewer.png
 cp -p %{_sourcedir}/log_viewer_start.sh $RPM_BUILD_ROOT/opt/LogViewer/
 
+# Pre-parse the default config into the JSON sidecar Log Viewer reads at startup;
+# written after config.yml is copied so it is newer than the YAML
+python3 %{SOURCE7} $RPM_BUILD_ROOT/opt/LogViewer/config.yml
+
 # Copy documentation
 cp -p %{_sourcedir}/Install_README.md $RPM_BUILD_ROOT/usr/share/doc/LogViewer/README.md
 
@@ -63,6 +70,7 @@ rm -rf $RPM_BUILD_ROOT
 %defattr(-,root,root,-)
 /opt/LogViewer/
 /opt/LogViewer/config.yml
+/opt/LogViewer/config.yml.json
 /opt/LogViewer/log_viewer
 /opt/LogViewer/smallicon.png
 %attr(0755,root,root) /opt/LogViewer/log_viewer_start.sh